@@ -4,13 +4,9 @@ A comprehensive analysis of the James Bond franchise and lead actor performance.
 """
 
 import streamlit as st
-from config import register_theme, EON_BOND_ACTORS, ACCENT_GOLD
+from config import register_theme, EON_BOND_ACTORS_ORDERED
 from data_loader import load_and_preprocess_data, get_data_path
 from components import initialize_page_styles, render_sidebar_filters
-from pages.overview import render_dashboard
-from pages.story_mode import render_story_mode
-from pages.actor_universe import render_actor_universe
-from pages.individual_charts import render_individual_chart
 
 
 # ============================================================================
@@ -26,7 +22,8 @@ st.set_page_config(
 # Register theme
 register_theme()
 
-# Initialize design system styles
+# Initialize design system styles. A rerun clears elements that are not emitted
+# again, so the stylesheet is sent on every run; the pages rely on this single call
 initialize_page_styles()
 
 # Hide page navigation and remove ALL top spacing
@@ -138,15 +135,20 @@ st.sidebar.markdown("---")
 # ============================================================================
 # PAGE ROUTING
 # ============================================================================
+# Page modules are imported on first visit, so a cold start only loads the page shown
 if page_mode == 'Bond Overview':
+    from pages.overview import render_dashboard
     df_filtered, _ = render_sidebar_filters(df_full)
     render_dashboard(df_full, df_filtered)
 
 elif page_mode == 'Individual Charts':
+    from pages.individual_charts import render_individual_chart
     render_individual_chart(df_full, chart_selection)
 
 elif page_mode == 'Story Mode':
+    from pages.story_mode import render_story_mode
     render_story_mode(df_full)
 
 else:  # Actor Universe
-    render_actor_universe(df_full, EON_BOND_ACTORS)
\ No newline at end of file
+    from pages.actor_universe import render_actor_universe
+    render_actor_universe(df_full, EON_BOND_ACTORS_ORDERED)
\ No newline at end of file
@@ -1,6 +1,10 @@
 """Chart generation functions for the dashboard."""
 
+import re
+from functools import lru_cache
+
 import altair as alt
+import numpy as np
 import pandas as pd
 
 try:
@@ -15,79 +19,222 @@ except ImportError:
     )
 
 
+# The specific Bond films to include (year and title keywords for matching)
+BOND_TARGET_FILMS = [
+    (1981, 'for your eyes only', 'Roger Moore'),
+    (1983, 'octopussy', 'Roger Moore'),
+    (1985, 'view to a kill', 'Roger Moore'),
+    (1987, 'living daylights', 'Timothy Dalton'),
+    (1989, 'licence to kill', 'Timothy Dalton'),
+    (1995, 'goldeneye', 'Pierce Brosnan'),
+    (1997, 'tomorrow never dies', 'Pierce Brosnan'),
+    (1999, 'world is not enough', 'Pierce Brosnan'),
+    (2002, 'die another day', 'Pierce Brosnan'),
+    (2006, 'casino royale', 'Daniel Craig'),
+    (2008, 'quantum of solace', 'Daniel Craig'),
+    (2012, 'skyfall', 'Daniel Craig'),
+    (2015, 'spectre', 'Daniel Craig'),
+    (2021, 'no time to die', 'Daniel Craig')
+]
+# 0/1 genre flag columns, in the order the genre charts list them
+GENRE_COLUMNS = ['Action', 'Adventure', 'Thriller', 'Romance', 'Sci-Fi', 'Comedy', 'Drama']
+# Narrow dtypes for frames shipped to the browser; halves the numeric payload
+CHART_DTYPES = {
+    'averageRating': 'float32',
+    'runtimeMinutes': 'float32',
+    'numVotes': 'float32',
+    'leadActor': 'category'
+}
+# Point marks past this count slow Vega's scenegraph more than they add to the picture
+CHART_POINT_LIMIT = 2000
+
+
+def drop_unused_categories(df):
+    """Prune category dictionaries to the values present; charts ship the whole dictionary."""
+    cat_cols = df.select_dtypes('category').columns
+    if cat_cols.empty:
+        return df
+    return df.assign(**{col: df[col].cat.remove_unused_categories() for col in cat_cols})
+
+
+def narrow_chart_dtypes(df):
+    """Cast whichever CHART_DTYPES columns ``df`` has to their compact chart dtypes."""
+    return drop_unused_categories(
+        df.astype({col: dtype for col, dtype in CHART_DTYPES.items() if col in df.columns})
+    )
+
+
+def downsample_for_chart(df, limit=CHART_POINT_LIMIT, by='releaseYear'):
+    """Stratified sample of ``df`` down to about ``limit`` rows, keeping each ``by`` group's share."""
+    if len(df) <= limit:
+        return df
+    # Fixed seed so reruns (and cached specs) show the same points
+    return df.groupby(by, observed=True).sample(frac=limit / len(df), random_state=0).sort_index()
+
+
+_BOND_TARGET_YEARS = np.fromiter((year for year, _, _ in BOND_TARGET_FILMS), dtype=np.int32)
+_BOND_TARGET_ACTORS = [actor for _, _, actor in BOND_TARGET_FILMS]
+# One named group per target so a single regex pass tells which keyword a title hit
+_BOND_TITLE_PATTERN = re.compile(
+    '|'.join(f'(?P<t{i}>{re.escape(keywords)})' for i, (_, keywords, _) in enumerate(BOND_TARGET_FILMS)),
+    re.IGNORECASE
+)
+
+
+def _match_bond_film_indices(df):
+    """Return the index labels of the rows matching BOND_TARGET_FILMS, in target order."""
+    # One pass over the year column restricts the title scan to the target years
+    candidates = df.loc[df['releaseYear'].isin(_BOND_TARGET_YEARS)]
+    
+    # Resolve every candidate title to the target whose keyword it contains, then
+    # keep only rows whose release year also matches that target
+    hits = candidates['primaryTitle'].str.extract(_BOND_TITLE_PATTERN).notna().to_numpy()
+    target_ids = hits.argmax(axis=1)
+    matched = hits.any(axis=1) & (candidates['releaseYear'].to_numpy() == _BOND_TARGET_YEARS[target_ids])
+    
+    # Compare actors as category codes; a target actor absent from the data gets -1,
+    # which is also the code for missing values, so it is excluded explicitly
+    actors = candidates['leadActor'].array
+    matched_targets = target_ids[matched]
+    target_codes = actors.categories.get_indexer(_BOND_TARGET_ACTORS)[matched_targets]
+    actor_hit = (actors.codes[matched] == target_codes) & (target_codes >= 0)
+    
+    # Per target, prefer the first row with the matching actor, else its first row
+    order = np.lexsort((~actor_hit, matched_targets))
+    _, first = np.unique(matched_targets[order], return_index=True)
+    return candidates.index[matched][order[first]].tolist()
+
+
 def filter_to_specific_bond_films(df):
     """Filter dataframe to only include the specific 14 Bond films."""
-    # Define the specific Bond films to include (year and title keywords for matching)
-    target_films = [
-        (1981, 'for your eyes only', 'Roger Moore'),
-        (1983, 'octopussy', 'Roger Moore'),
-        (1985, 'view to a kill', 'Roger Moore'),
-        (1987, 'living daylights', 'Timothy Dalton'),
-        (1989, 'licence to kill', 'Timothy Dalton'),
-        (1995, 'goldeneye', 'Pierce Brosnan'),
-        (1997, 'tomorrow never dies', 'Pierce Brosnan'),
-        (1999, 'world is not enough', 'Pierce Brosnan'),
-        (2002, 'die another day', 'Pierce Brosnan'),
-        (2006, 'casino royale', 'Daniel Craig'),
-        (2008, 'quantum of solace', 'Daniel Craig'),
-        (2012, 'skyfall', 'Daniel Craig'),
-        (2015, 'spectre', 'Daniel Craig'),
-        (2021, 'no time to die', 'Daniel Craig')
-    ]
-    
-    # Filter to only the specific films
-    filtered_films = []
-    for year, title_keywords, actor in target_films:
-        # Match by year and title keywords (case-insensitive)
-        matches = df[
-            (df['releaseYear'] == year) &
-            (df['primaryTitle'].str.lower().str.contains(title_keywords, case=False, na=False))
-        ]
-        if not matches.empty:
-            # If multiple matches, prefer the one with matching actor if available
-            if actor in matches['leadActor'].values:
-                matches = matches[matches['leadActor'] == actor]
-            filtered_films.append(matches.iloc[0])
+    picked_indices = _match_bond_film_indices(df)
     
-    if not filtered_films:
+    if not picked_indices:
         return pd.DataFrame()
     
-    # Convert to DataFrame
-    return pd.DataFrame(filtered_films)
-
+    # Gather all matched rows in one indexing call
+    return drop_unused_categories(df.loc[picked_indices])
+
+
+# Placeholder data source for cached chart templates; replaced by a DataFrame per render
+_TEMPLATE_DATA = alt.NamedData(name='template')
+
+
+def chart_to_spec(chart):
+    """Vega-Lite dict for ``chart`` with its DataFrames split out under ``datasets``.
+    
+    Streamlit ships those frames as Arrow just as it does for Altair charts, so the
+    dict can be cached and rendered with st.vega_lite_chart.
+    """
+    # Deep copy of the spec tree only; the DataFrames inside are shared by reference
+    chart = chart.copy()
+    datasets = {}
+    _name_datasets(chart, datasets, {})
+    spec = chart.to_dict()
+    spec['datasets'] = {**spec.get('datasets', {}), **datasets}
+    return spec
+
+
+def _name_datasets(chart, datasets, names):
+    """Swap each DataFrame in ``chart`` (and its sub-charts) for a NamedData reference."""
+    data = chart._get('data')
+    if isinstance(data, pd.DataFrame):
+        # Layers drawn from the same frame share one dataset
+        if id(data) not in names:
+            names[id(data)] = f'data-{len(names)}'
+            datasets[names[id(data)]] = data
+        chart.data = alt.NamedData(name=names[id(data)])
+    for key in ('layer', 'hconcat', 'vconcat', 'concat'):
+        for sub_chart in chart._get(key, []):
+            _name_datasets(sub_chart, datasets, names)
+
+
+def _chart_from_template(build_template, data):
+    """Instantiate a cached Vega-Lite template with the ``data`` DataFrame as its source.
+    
+    The frame stays a DataFrame, so chart_to_spec still ships it as an Arrow dataset.
+    """
+    spec = build_template()
+    chart_class = alt.LayerChart if 'layer' in spec else alt.Chart
+    # from_dict builds fresh wrapper objects, and the placeholder data is replaced on
+    # the chart rather than in the cached dict
+    chart = chart_class.from_dict(spec, validate=False)
+    chart.data = data
+    return chart
 
-def create_actor_performance_chart(df_filtered):
-    """Create actor performance ranking bar chart."""
-    actor_ratings = df_filtered.groupby('leadActor').agg(
-        averageRating=('averageRating', 'mean'),
-        totalFilms=('primaryTitle', 'count')
-    ).reset_index()
 
-    chart = alt.Chart(actor_ratings).mark_bar().encode(
+@lru_cache(maxsize=None)
+def _actor_performance_template():
+    """Vega-Lite spec for the actor performance chart, built and validated once."""
+    return alt.Chart(_TEMPLATE_DATA).mark_bar().encode(
         y=alt.Y('leadActor:N', sort='-x', title="Lead Actor"),
         x=alt.X('averageRating:Q', title="Average IMDb Rating", scale=alt.Scale(domain=[0, 10])),
         color=alt.Color('averageRating:Q', scale=alt.Scale(range=[ACCENT_ORANGE, ACCENT_BLUE]), legend=None),
         tooltip=[
-            alt.Tooltip('leadActor', title="Actor"),
-            alt.Tooltip('averageRating', title="Avg. Rating", format=".2f"),
-            alt.Tooltip('totalFilms', title="Film Count")
+            alt.Tooltip('leadActor:N', title="Actor"),
+            alt.Tooltip('averageRating:Q', title="Avg. Rating", format=".2f"),
+            alt.Tooltip('totalFilms:Q', title="Film Count")
         ]
-    ).properties(height=300)
+    ).properties(height=300).to_dict()
+
+
+def _grouped_mean_count(keys, values, n_groups):
+    """Present group keys with the mean and count of ``values`` per key, via np.bincount."""
+    counts = np.bincount(keys, minlength=n_groups)
+    sums = np.bincount(keys, weights=values, minlength=n_groups)
+    present = np.flatnonzero(counts)
+    # bincount sums in float64; hand the means back in the input dtype like groupby does
+    means = (sums[present] / counts[present]).astype(values.dtype, copy=False)
+    return present, means, counts[present]
+
+
+def create_actor_performance_chart(df_filtered):
+    """Create actor performance ranking bar chart."""
+    # Group on the leadActor category codes; same rows and order as an observed groupby
+    actors = df_filtered['leadActor'].array
+    present, mean_rating, film_count = _grouped_mean_count(
+        actors.codes, df_filtered['averageRating'].to_numpy(), len(actors.categories)
+    )
+    actor_ratings = pd.DataFrame({
+        'leadActor': pd.Categorical.from_codes(present, dtype=actors.dtype),
+        'averageRating': mean_rating,
+        'totalFilms': film_count
+    })
+
+    return _chart_from_template(_actor_performance_template, actor_ratings)
+
+
+# Shared legend selection for the actor-coloured charts, built once at import
+_ACTOR_SEL = alt.selection_point(fields=['leadActor'], bind='legend')
+# Rating-band colour scale for the film timeline, also built once
+_RATING_BAND_SCALE = alt.Scale(
+    domain=('Below 6', '6-7', '7-8', '8+'),
+    range=(ACCENT_RED, ACCENT_ORANGE, ACCENT_GREEN, ACCENT_BLUE)
+)
+
+
+def _log_trendline(data, **mark_kwargs):
+    """Least-squares fit of averageRating on ln(numVotes), drawn between the vote extremes.
     
-    return chart
+    Same fit as Vega's log regression, but solved once here with np.polyfit so the
+    browser draws two points instead of regressing the whole layer.
+    """
+    votes = data['numVotes'].to_numpy(dtype=np.float64)
+    slope, intercept = np.polyfit(np.log(votes), data['averageRating'].to_numpy(dtype=np.float64), 1)
+    ends = np.array([votes.min(), votes.max()])
+    line = pd.DataFrame({'numVotes': ends, 'averageRating': intercept + slope * np.log(ends)})
+    return alt.Chart(line).mark_line(**mark_kwargs).encode(x='numVotes:Q', y='averageRating:Q')
 
 
 def create_rating_trend_chart(df_filtered):
     """Create rating trend over time chart."""
-    actor_selection = alt.selection_point(fields=['leadActor'], bind='legend')
-
     line_chart = alt.Chart(df_filtered).mark_point(filled=True, size=60).encode(
         x=alt.X('releaseYear:O', title="Release Year"),
         y=alt.Y('averageRating:Q', title="IMDb Rating", scale=alt.Scale(domain=[5, 10])),
         color=alt.Color('leadActor:N', title="Actor"),
-        opacity=alt.condition(actor_selection, alt.value(0.9), alt.value(0.2)),
-        tooltip=['primaryTitle', 'releaseYear', alt.Tooltip('averageRating', format=".2f"), 'leadActor']
-    ).add_params(actor_selection).properties(height=300)
+        opacity=alt.condition(_ACTOR_SEL, alt.value(0.9), alt.value(0.2)),
+        tooltip=['primaryTitle:N', 'releaseYear:Q', alt.Tooltip('averageRating:Q', format=".2f"), 'leadActor:N']
+    ).add_params(_ACTOR_SEL).properties(height=300)
 
     # Add trend line only if enough data
     if len(df_filtered) >= 3:
@@ -99,63 +246,15 @@ def create_rating_trend_chart(df_filtered):
     return line_chart
 
 
-def create_bond_films_rating_chart(df_full):
-    """Create chart showing IMDb ratings for specific James Bond films only, color-coded by actor."""
-    # Define the specific Bond films to include (year and title keywords for matching)
-    target_films = [
-        (1981, 'for your eyes only', 'Roger Moore'),
-        (1983, 'octopussy', 'Roger Moore'),
-        (1985, 'view to a kill', 'Roger Moore'),
-        (1987, 'living daylights', 'Timothy Dalton'),
-        (1989, 'licence to kill', 'Timothy Dalton'),
-        (1995, 'goldeneye', 'Pierce Brosnan'),
-        (1997, 'tomorrow never dies', 'Pierce Brosnan'),
-        (1999, 'world is not enough', 'Pierce Brosnan'),
-        (2002, 'die another day', 'Pierce Brosnan'),
-        (2006, 'casino royale', 'Daniel Craig'),
-        (2008, 'quantum of solace', 'Daniel Craig'),
-        (2012, 'skyfall', 'Daniel Craig'),
-        (2015, 'spectre', 'Daniel Craig'),
-        (2021, 'no time to die', 'Daniel Craig')
-    ]
-    
-    # Filter to only James Bond films first
-    bond_films = df_full[df_full['is_bond_core'] == True].copy()
+def create_bond_films_rating_chart(bond_films):
+    """Create chart showing IMDb ratings for specific James Bond films only, color-coded by actor.
     
+    Expects the precomputed table from ``data_loader.load_bond_films``.
+    """
     if bond_films.empty:
         return None
     
-    # Filter to only the specific films
-    filtered_films = []
-    for year, title_keywords, actor in target_films:
-        # Match by year and title keywords (case-insensitive)
-        matches = bond_films[
-            (bond_films['releaseYear'] == year) &
-            (bond_films['primaryTitle'].str.lower().str.contains(title_keywords, case=False, na=False))
-        ]
-        if not matches.empty:
-            # If multiple matches, prefer the one with matching actor if available
-            if actor in matches['leadActor'].values:
-                matches = matches[matches['leadActor'] == actor]
-            filtered_films.append(matches.iloc[0])
-    
-    if not filtered_films:
-        return None
-    
-    # Convert to DataFrame
-    bond_films = pd.DataFrame(filtered_films)
-    
-    # Sort by release year to ensure chronological order
-    bond_films = bond_films.sort_values('releaseYear').reset_index(drop=True)
-    
-    # Create titles with year for x-axis labels (use full title, not abbreviated)
-    bond_films['title_short'] = bond_films['primaryTitle'] + ' (' + bond_films['releaseYear'].astype(str) + ')'
-    
-    # Calculate average rating for the average line
-    avg_rating = bond_films['averageRating'].mean()
-    
-    # Add actor selection (same as create_rating_trend_chart)
-    actor_selection = alt.selection_point(fields=['leadActor'], bind='legend')
+    avg_rating = bond_films.attrs['avg_rating']
     
     # Main chart with points (removed white stroke)
     point_chart = alt.Chart(bond_films).mark_point(filled=True, size=120).encode(
@@ -167,7 +266,7 @@ def create_bond_films_rating_chart(df_full):
         ),
         y=alt.Y('averageRating:Q', title="IMDb Rating", scale=alt.Scale(domain=[5, 10])),
         color=alt.Color('leadActor:N', title="Bond Actor", legend=alt.Legend(title="Actor")),
-        opacity=alt.condition(actor_selection, alt.value(0.9), alt.value(0.2)),
+        opacity=alt.condition(_ACTOR_SEL, alt.value(0.9), alt.value(0.2)),
         tooltip=[
             alt.Tooltip('primaryTitle:N', title="Film"),
             alt.Tooltip('releaseYear:O', title="Year"),
@@ -175,7 +274,7 @@ def create_bond_films_rating_chart(df_full):
             alt.Tooltip('leadActor:N', title="Actor"),
             alt.Tooltip('numVotes:Q', title="Votes", format=",")
         ]
-    ).add_params(actor_selection).properties(
+    ).add_params(_ACTOR_SEL).properties(
         height=400,
         width=1200
     )
@@ -195,62 +294,31 @@ def create_bond_films_rating_chart(df_full):
     return chart
 
 
+# Columns encoded by the comparison chart; everything else would only inflate the payload
+_COMPARISON_COLUMNS = ['primaryTitle', 'leadActor', 'averageRating', 'numVotes', 'releaseYear']
+
+
 def create_bond_comparison_chart(df_full):
     """Create Bond vs Other Thriller Films comparison chart."""
-    # Define the specific Bond films to include (year and title keywords for matching)
-    target_films = [
-        (1981, 'for your eyes only', 'Roger Moore'),
-        (1983, 'octopussy', 'Roger Moore'),
-        (1985, 'view to a kill', 'Roger Moore'),
-        (1987, 'living daylights', 'Timothy Dalton'),
-        (1989, 'licence to kill', 'Timothy Dalton'),
-        (1995, 'goldeneye', 'Pierce Brosnan'),
-        (1997, 'tomorrow never dies', 'Pierce Brosnan'),
-        (1999, 'world is not enough', 'Pierce Brosnan'),
-        (2002, 'die another day', 'Pierce Brosnan'),
-        (2006, 'casino royale', 'Daniel Craig'),
-        (2008, 'quantum of solace', 'Daniel Craig'),
-        (2012, 'skyfall', 'Daniel Craig'),
-        (2015, 'spectre', 'Daniel Craig'),
-        (2021, 'no time to die', 'Daniel Craig')
-    ]
-    
-    df_comparison = df_full[df_full['Thriller'] == 1].copy()
-    
-    # Filter to only the specific Bond films and track their indices
-    bond_films_list = []
-    bond_indices = set()
-    
-    for year, title_keywords, actor in target_films:
-        # Match by year and title keywords (case-insensitive)
-        matches = df_comparison[
-            (df_comparison['releaseYear'] == year) &
-            (df_comparison['primaryTitle'].str.lower().str.contains(title_keywords, case=False, na=False))
-        ]
-        if not matches.empty:
-            # If multiple matches, prefer the one with matching actor if available
-            if actor in matches['leadActor'].values:
-                matches = matches[matches['leadActor'] == actor]
-            selected_match = matches.iloc[0]
-            bond_films_list.append(selected_match)
-            bond_indices.add(selected_match.name)  # Track the original index
-    
-    # Create bond_films_data DataFrame
-    if bond_films_list:
-        bond_films_data = pd.DataFrame(bond_films_list)
-    else:
-        bond_films_data = pd.DataFrame()
+    thriller_mask = df_full['Thriller'].to_numpy(dtype=bool, na_value=False)
+    df_comparison = df_full.iloc[thriller_mask]
+    
+    # Filter to only the specific Bond films, keeping their original indices
+    bond_indices = _match_bond_film_indices(df_comparison)
+    df_comparison = df_comparison[_COMPARISON_COLUMNS]
+    bond_films_data = narrow_chart_dtypes(df_comparison.loc[bond_indices])
     
     # All other thriller films (excluding the specific Bond films)
-    other_films_data = df_comparison[~df_comparison.index.isin(bond_indices)].copy()
+    other_films_data = narrow_chart_dtypes(df_comparison.loc[~df_comparison.index.isin(bond_indices)])
     
-    # Other thriller films scatter
-    other_scatter = alt.Chart(other_films_data).mark_circle(size=60, opacity=0.4, color='#9CA3AF').encode(
+    # Other thriller films scatter; the full frame is still returned for the page's stats
+    other_points = downsample_for_chart(other_films_data)
+    other_scatter = alt.Chart(other_points).mark_circle(size=60, opacity=0.4, color='#9CA3AF').encode(
         x=alt.X('numVotes:Q', title="Number of Votes", scale=alt.Scale(type='log', domain=[100, 10000000])),
         y=alt.Y('averageRating:Q', title="IMDb Rating", scale=alt.Scale(domain=[4, 10])),
         tooltip=[
-            'primaryTitle', 'leadActor', alt.Tooltip('averageRating', format=".2f"),
-            alt.Tooltip('numVotes', format=","), 'releaseYear'
+            'primaryTitle:N', 'leadActor:N', alt.Tooltip('averageRating:Q', format=".2f"),
+            alt.Tooltip('numVotes:Q', format=","), 'releaseYear:Q'
         ]
     )
     
@@ -259,28 +327,21 @@ def create_bond_comparison_chart(df_full):
         x=alt.X('numVotes:Q'),
         y=alt.Y('averageRating:Q'),
         tooltip=[
-            'primaryTitle', 'leadActor', alt.Tooltip('averageRating', format=".2f"),
-            alt.Tooltip('numVotes', format=","), 'releaseYear'
+            'primaryTitle:N', 'leadActor:N', alt.Tooltip('averageRating:Q', format=".2f"),
+            alt.Tooltip('numVotes:Q', format=","), 'releaseYear:Q'
         ]
     )
     
     # Build layers dynamically
     layers = [other_scatter, bond_scatter]
     
+    # The fit uses every film; the sample above only thins the scatter payload
     if len(other_films_data) >= 3:
-        other_trend = alt.Chart(other_films_data).transform_regression(
-            'numVotes', 'averageRating', method='log'
-        ).mark_line(color='#9CA3AF', size=3, strokeDash=[5, 5]).encode(
-            x=alt.X('numVotes:Q'), y=alt.Y('averageRating:Q')
-        )
+        other_trend = _log_trendline(other_films_data, color='#9CA3AF', size=3, strokeDash=[5, 5])
         layers.insert(1, other_trend)
     
     if len(bond_films_data) >= 3:
-        bond_trend = alt.Chart(bond_films_data).transform_regression(
-            'numVotes', 'averageRating', method='log'
-        ).mark_line(color=ACCENT_GOLD, size=4).encode(
-            x=alt.X('numVotes:Q'), y=alt.Y('averageRating:Q')
-        )
+        bond_trend = _log_trendline(bond_films_data, color=ACCENT_GOLD, size=4)
         layers.append(bond_trend)
     
     chart = alt.layer(*layers).properties(
@@ -313,16 +374,32 @@ def create_runtime_rating_chart(df_filtered):
                                       symbolStrokeWidth=1)),
         color=alt.Color('leadActor:N', title="Actor"),
         tooltip=[
-            'primaryTitle', 'leadActor',
-            alt.Tooltip('runtimeMinutes', title="Runtime (mins)"),
-            alt.Tooltip('averageRating', title="Rating", format=".2f"),
-            alt.Tooltip('numVotes', title="Votes", format=",")
+            'primaryTitle:N', 'leadActor:N',
+            alt.Tooltip('runtimeMinutes:Q', title="Runtime (mins)"),
+            alt.Tooltip('averageRating:Q', title="Rating", format=".2f"),
+            alt.Tooltip('numVotes:Q', title="Votes", format=",")
         ]
-    ).properties(height=300).interactive()
+    ).properties(height=300)
     
     return chart
 
 
+def genre_counts_by_decade(df):
+    """Long-form (decade, Genre, Count) genre totals of ``df``, keeping non-zero counts only."""
+    # One bincount per genre over the decade codes instead of a groupby, sum and melt
+    decades, decade_codes = np.unique(df['decade'].to_numpy(), return_inverse=True)
+    counts = np.stack([
+        np.bincount(decade_codes, weights=df[genre].to_numpy(), minlength=len(decades))
+        for genre in GENRE_COLUMNS
+    ]).astype(np.int64)
+    keep = counts.ravel() > 0
+    return pd.DataFrame({
+        'decade': np.tile(decades, len(GENRE_COLUMNS))[keep],
+        'Genre': np.repeat(GENRE_COLUMNS, len(decades))[keep],
+        'Count': counts.ravel()[keep]
+    })
+
+
 def create_genre_evolution_chart(df_filtered):
     """Create genre evolution by decade chart."""
     # Filter to only specific Bond films
@@ -331,18 +408,15 @@ def create_genre_evolution_chart(df_filtered):
     if df_filtered.empty:
         return None
     
-    genre_cols = ['Action', 'Adventure', 'Thriller', 'Romance', 'Sci-Fi', 'Comedy', 'Drama']
-    df_genres = df_filtered.groupby('decade')[genre_cols].sum().reset_index()
-    df_genres_melted = df_genres.melt('decade', value_vars=genre_cols, var_name='Genre', value_name='Count')
-    df_genres_melted = df_genres_melted[df_genres_melted['Count'] > 0]
+    df_genres_melted = genre_counts_by_decade(df_filtered)
     
     chart = alt.Chart(df_genres_melted).mark_bar().encode(
         x=alt.X('decade:O', title="Decade", axis=alt.Axis(labelAngle=0)),
         y=alt.Y('Count:Q', title="Genre Count"),
         color=alt.Color('Genre:N', title="Genre"),
         order=alt.Order('decade:O'),
-        tooltip=['decade', 'Genre', 'Count']
-    ).properties(height=300).interactive()
+        tooltip=['decade:Q', 'Genre:N', 'Count:Q']
+    ).properties(height=300)
     
     return chart
 
@@ -355,10 +429,7 @@ def create_genre_trend_chart(df_filtered):
     if df_filtered.empty:
         return None
     
-    genre_cols = ['Action', 'Adventure', 'Thriller', 'Romance', 'Sci-Fi', 'Comedy', 'Drama']
-    df_genres = df_filtered.groupby('decade')[genre_cols].sum().reset_index()
-    df_genres_melted = df_genres.melt('decade', value_vars=genre_cols, var_name='Genre', value_name='Count')
-    df_genres_melted = df_genres_melted[df_genres_melted['Count'] > 0]
+    df_genres_melted = genre_counts_by_decade(df_filtered)
     
     if df_genres_melted.empty:
         return None
@@ -377,21 +448,41 @@ def create_genre_trend_chart(df_filtered):
     return chart
 
 
-def create_rating_distribution_chart(df_filtered):
-    """Create rating distribution strip chart."""
-    strip_chart = alt.Chart(df_filtered).mark_circle(size=70, opacity=0.7).encode(
+@lru_cache(maxsize=None)
+def _rating_distribution_template():
+    """Vega-Lite spec for the rating distribution chart, built and validated once."""
+    strip_chart = alt.Chart().mark_circle(size=70, opacity=0.7).encode(
         x=alt.X('averageRating:Q', title="IMDb Rating", scale=alt.Scale(domain=[5, 10])),
         y=alt.Y('leadActor:N', title="Lead Actor"),
         color=alt.Color('leadActor:N', legend=None),
-        tooltip=['primaryTitle', 'leadActor', alt.Tooltip('averageRating', title="Rating", format=".2f")]
+        tooltip=['primaryTitle:N', 'leadActor:N', alt.Tooltip('averageRating:Q', title="Rating", format=".2f")]
     ).properties(height=300).interactive()
 
-    mean_line = alt.Chart(df_filtered).mark_rule(color=ACCENT_RED, size=2).encode(
+    mean_line = alt.Chart().mark_rule(color=ACCENT_RED, size=2).encode(
         x='mean(averageRating):Q',
         y='leadActor:N'
     )
 
-    return strip_chart + mean_line
+    return alt.layer(strip_chart, mean_line, data=_TEMPLATE_DATA).to_dict()
+
+
+def create_rating_distribution_chart(df_filtered):
+    """Create rating distribution strip chart."""
+    return _chart_from_template(
+        _rating_distribution_template,
+        df_filtered[['primaryTitle', 'leadActor', 'averageRating']]
+    )
+
+
+@lru_cache(maxsize=None)
+def _production_volume_template():
+    """Vega-Lite spec for the production volume chart, built and validated once."""
+    return alt.Chart(_TEMPLATE_DATA).mark_bar().encode(
+        x=alt.X('decade:O', title="Decade", axis=alt.Axis(labelAngle=0)),
+        y=alt.Y('count:Q', title="Number of Films"),
+        color=alt.Color('count:Q', scale=alt.Scale(range=[ACCENT_ORANGE, ACCENT_BLUE]), legend=None),
+        tooltip=[alt.Tooltip('decade:O', title='Decade'), alt.Tooltip('count:Q', title='Films')]
+    ).properties(height=300).to_dict()
 
 
 def create_production_volume_chart(df_filtered):
@@ -404,24 +495,25 @@ def create_production_volume_chart(df_filtered):
     
     decade_data = df_filtered.groupby('decade').size().reset_index(name='count')
     
-    chart = alt.Chart(decade_data).mark_bar().encode(
-        x=alt.X('decade:O', title="Decade", axis=alt.Axis(labelAngle=0)),
-        y=alt.Y('count:Q', title="Number of Films"),
-        color=alt.Color('count:Q', scale=alt.Scale(range=[ACCENT_ORANGE, ACCENT_BLUE]), legend=None),
-        tooltip=[alt.Tooltip('decade:O', title='Decade'), alt.Tooltip('count:Q', title='Films')]
-    ).properties(height=300)
-    
-    return chart
+    return _chart_from_template(_production_volume_template, decade_data)
 
 
 def create_performance_heatmap(df_filtered):
     """Create performance heatmap by actor and decade."""
-    heatmap_data = df_filtered.groupby(['leadActor', 'decade']).agg(
-        avg_rating=('averageRating', 'mean'),
-        film_count=('primaryTitle', 'count')
-    ).reset_index()
-    
-    heatmap_data = heatmap_data[heatmap_data['film_count'] > 0]
+    # One bincount over combined (actor, decade) codes; only non-empty cells come back
+    actors = df_filtered['leadActor'].array
+    decades, decade_codes = np.unique(df_filtered['decade'].to_numpy(), return_inverse=True)
+    present, avg_rating, film_count = _grouped_mean_count(
+        actors.codes * len(decades) + decade_codes,
+        df_filtered['averageRating'].to_numpy(),
+        len(actors.categories) * len(decades)
+    )
+    heatmap_data = pd.DataFrame({
+        'leadActor': pd.Categorical.from_codes(present // len(decades), dtype=actors.dtype),
+        'decade': decades[present % len(decades)],
+        'avg_rating': avg_rating,
+        'film_count': film_count
+    })
     
     chart = alt.Chart(heatmap_data).mark_rect().encode(
         x=alt.X('decade:O', title="Decade"),
@@ -458,23 +550,18 @@ def create_engagement_boxplot(df_filtered):
 
 def create_film_timeline_chart(df_filtered):
     """Create complete film timeline chart."""
-    df_timeline = df_filtered.copy()
-    df_timeline['rating_band'] = pd.cut(
-        df_timeline['averageRating'],
-        bins=[0, 6, 7, 8, 10],
-        labels=['Below 6', '6-7', '7-8', '8+']
-    )
-    
-    chart = alt.Chart(df_timeline).mark_circle(size=100, stroke='white', strokeWidth=1).encode(
+    # Rating bands are derived in Vega (same right-closed bins as pd.cut(bins=[0, 6, 7, 8, 10]))
+    # so the filtered frame is passed through without a pandas copy.
+    chart = alt.Chart(downsample_for_chart(df_filtered)).transform_calculate(
+        rating_band=(
+            "datum.averageRating <= 6 ? 'Below 6' : "
+            "datum.averageRating <= 7 ? '6-7' : "
+            "datum.averageRating <= 8 ? '7-8' : '8+'"
+        )
+    ).mark_circle(size=100, stroke='white', strokeWidth=1).encode(
         x=alt.X('releaseYear:O', title="Release Year"),
         y=alt.Y('leadActor:N', title="Actor"),
-        color=alt.Color('rating_band:N',
-            scale=alt.Scale(
-                domain=['Below 6', '6-7', '7-8', '8+'],
-                range=[ACCENT_RED, ACCENT_ORANGE, ACCENT_GREEN, ACCENT_BLUE]
-            ),
-            title="Rating Band"
-        ),
+        color=alt.Color('rating_band:N', scale=_RATING_BAND_SCALE, title="Rating Band"),
         size=alt.Size('numVotes:Q', 
                      scale=alt.Scale(range=[50, 500]), 
                      title="Popularity",
@@ -485,7 +572,7 @@ def create_film_timeline_chart(df_filtered):
                                       symbolStrokeColor='white',
                                       symbolStrokeWidth=1)),
         tooltip=[
-            'primaryTitle', 'leadActor', 'releaseYear',
+            'primaryTitle:N', 'leadActor:N', 'releaseYear:Q',
             alt.Tooltip('averageRating:Q', format='.2f'),
             alt.Tooltip('numVotes:Q', format=',')
         ]
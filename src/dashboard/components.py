@@ -3,11 +3,15 @@ Professional UI components with consistent design system.
 All components aligned to design_system.py specifications.
 """
 
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
 import streamlit as st
 
 try:
-    from .config import EON_BOND_ACTORS
-    from .charts import filter_to_specific_bond_films
+    from .config import EON_BOND_ACTORS, EON_BOND_ACTORS_ORDERED
+    from .charts import filter_to_specific_bond_films, drop_unused_categories, chart_to_spec
     from .design_system import (
         inject_global_styles,
         get_section_header_style,
@@ -18,8 +22,8 @@ try:
         SPACING_LG
     )
 except ImportError:
-    from config import EON_BOND_ACTORS
-    from charts import filter_to_specific_bond_films
+    from config import EON_BOND_ACTORS, EON_BOND_ACTORS_ORDERED
+    from charts import filter_to_specific_bond_films, drop_unused_categories, chart_to_spec
     from design_system import (
         inject_global_styles,
         get_section_header_style,
@@ -36,38 +40,39 @@ except ImportError:
 
 
 def initialize_page_styles():
-    """Initialize all design system styles - CALL THIS AT TOP OF EVERY PAGE"""
+    """Initialize all design system styles - called once per run by bond_dashboard.py"""
     inject_global_styles()
 
 
-def render_page_header(title, subtitle=""):
-    """
-    Render professional page header with consistent styling.
-    
-    Args:
-        title: Main page title (e.g., "Bond Overview")
-        subtitle: Optional subtitle with more context
-    """
-    st.markdown(f"""
+@lru_cache(maxsize=256)
+def _page_header_html(title, subtitle):
+    """HTML for a page header; cached since titles are constant per page."""
+    return f"""
     <div style="text-align: center; margin-top: 0; margin-bottom: 20px; padding-top: 0;">
         <h1 style="font-size: 48px; font-weight: bold; color: white; margin: 0; padding: 0; letter-spacing: 1px;">
             {title}
         </h1>
         {f'<p style="font-size: 16px; color: #FFD700; margin: 8px 0 0 0; padding: 0;">{subtitle}</p>' if subtitle else ''}
     </div>
-    """, unsafe_allow_html=True)
-    st.markdown("---")
+    """
 
 
-def render_section_header(title, description=""):
+def render_page_header(title, subtitle=""):
     """
-    Render consistent section header with title and optional description.
+    Render professional page header with consistent styling.
     
     Args:
-        title: Section title (required)
-        description: Optional descriptive text (optional)
+        title: Main page title (e.g., "Bond Overview")
+        subtitle: Optional subtitle with more context
     """
-    st.markdown(f"""
+    st.markdown(_page_header_html(title, subtitle), unsafe_allow_html=True)
+    st.markdown("---")
+
+
+@lru_cache(maxsize=256)
+def _section_header_html(title, description):
+    """HTML for a section header; cached since headers are constant per page."""
+    return f"""
     <div style="margin-bottom: 16px;">
         <h2 style="
             font-size: 28px;
@@ -80,7 +85,55 @@ def render_section_header(title, description=""):
         {f'<p style="font-size: 14px; color: #999; margin: 0; padding: 0;">{description}</p>' if description else ''}
     </div>
     <div style="height: 2px; background: linear-gradient(90deg, #FFD700, transparent); margin: 12px 0 20px 0;"></div>
-    """, unsafe_allow_html=True)
+    """
+
+
+def render_section_header(title, description=""):
+    """
+    Render consistent section header with title and optional description.
+    
+    Args:
+        title: Section title (required)
+        description: Optional descriptive text (optional)
+    """
+    st.markdown(_section_header_html(title, description), unsafe_allow_html=True)
+
+
+@lru_cache(maxsize=256)
+def _page_footer_html(title, tagline, note):
+    """HTML for a page footer; cached since footers are constant per page."""
+    return f"""
+    <div style="text-align: center; color: #666; margin-top: 40px; padding: 20px; border-top: 1px solid #333;">
+        <small>
+        <strong>{title}</strong> | {tagline}<br>
+        <em>{note}</em>
+        </small>
+    </div>
+    """
+
+
+def render_page_footer(title, tagline, note):
+    """
+    Render the centred page footer.
+    
+    Args:
+        title: Bold lead-in (e.g., "Actor Universe")
+        tagline: Text after the title on the first line
+        note: Italic second line (data source, update date)
+    """
+    st.markdown(_page_footer_html(title, tagline, note), unsafe_allow_html=True)
+
+
+@lru_cache(maxsize=256)
+def _metric_card_html(label, value, context):
+    """HTML for a metric card; cached since most values repeat across reruns."""
+    return f"""
+    <div class="metric-card">
+        <div class="metric-label">{label}</div>
+        <div class="metric-value">{value}</div>
+        {f'<small style="color: #999; margin-top: 8px;">{context}</small>' if context else ''}
+    </div>
+    """
 
 
 def render_metric_card(label, value, context="", width=None):
@@ -93,13 +146,16 @@ def render_metric_card(label, value, context="", width=None):
         context: Optional context text
         width: Optional width (for use in columns)
     """
-    st.markdown(f"""
-    <div class="metric-card">
-        <div class="metric-label">{label}</div>
-        <div class="metric-value">{value}</div>
-        {f'<small style="color: #999; margin-top: 8px;">{context}</small>' if context else ''}
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_metric_card_html(label, value, context), unsafe_allow_html=True)
+
+
+def _card_grid_html(cards, num_cols):
+    """Lay out card fragments in one CSS grid; lines are flattened so blank lines don't end the HTML block."""
+    inner = "".join(line.strip() for card in cards for line in card.splitlines())
+    return (
+        f'<div style="display: grid; grid-template-columns: repeat({num_cols}, 1fr); gap: 16px;">'
+        f'{inner}</div>'
+    )
 
 
 def render_metrics_row(metrics_list):
@@ -113,16 +169,24 @@ def render_metrics_row(metrics_list):
             ...
         ]
     """
-    cols = st.columns(4)
-    for idx, col in enumerate(cols):
-        if idx < len(metrics_list):
-            with col:
-                metric = metrics_list[idx]
-                render_metric_card(
-                    metric['label'],
-                    metric['value'],
-                    metric.get('context', '')
-                )
+    # One markdown element for the whole row instead of st.columns plus a card per column
+    cards = [
+        _metric_card_html(metric['label'], metric['value'], metric.get('context', ''))
+        for metric in metrics_list[:4]
+    ]
+    st.markdown(_card_grid_html(cards, 4), unsafe_allow_html=True)
+
+
+@lru_cache(maxsize=256)
+def _insight_card_html(label, value, context):
+    """HTML for an insight card; cached since most values repeat across reruns."""
+    return f"""
+    <div class="insight-card">
+        <div class="insight-label">{label}</div>
+        <div class="insight-value">{value}</div>
+        {f'<div class="insight-context">{context}</div>' if context else ''}
+    </div>
+    """
 
 
 def render_insight_card(label, value, context=""):
@@ -134,13 +198,7 @@ def render_insight_card(label, value, context=""):
         value: Main insight value/finding
         context: Optional additional context
     """
-    st.markdown(f"""
-    <div class="insight-card">
-        <div class="insight-label">{label}</div>
-        <div class="insight-value">{value}</div>
-        {f'<div class="insight-context">{context}</div>' if context else ''}
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_insight_card_html(label, value, context), unsafe_allow_html=True)
 
 
 def render_insight_row(insights_list):
@@ -156,17 +214,21 @@ def render_insight_row(insights_list):
     
     # Determine columns: 2-3 insights per row
     num_cols = min(3, num_insights)
-    cols = st.columns(num_cols)
+    cards = [
+        _insight_card_html(insight['label'], insight['value'], insight.get('context', ''))
+        for insight in insights_list[:num_cols]
+    ]
+    st.markdown(_card_grid_html(cards, num_cols), unsafe_allow_html=True)
+
+
+@st.cache_data(show_spinner=False)
+def cached_chart_spec(name, fingerprint, _builder, _df):
+    """Vega-Lite spec for ``_builder(_df)``, rebuilt only when ``(name, fingerprint)`` changes.
     
-    for idx, col in enumerate(cols):
-        if idx < num_insights:
-            with col:
-                insight = insights_list[idx]
-                render_insight_card(
-                    insight['label'],
-                    insight['value'],
-                    insight.get('context', '')
-                )
+    Frames in the spec's datasets reach the browser as Arrow, not JSON records.
+    """
+    chart = _builder(_df)
+    return None if chart is None else chart_to_spec(chart)
 
 
 def render_chart_with_description(
@@ -184,38 +246,35 @@ def render_chart_with_description(
         title: Chart title
         description: 2-3 sentence explanation of what chart shows
         key_insight: What pattern/trend to notice
-        chart_element: The Altair chart object or st.altair_chart call result
+        chart_element: The Altair chart object, or a Vega-Lite spec dict
         interaction_tip: Optional interaction guidance
         use_container_width: Whether chart uses full width
     """
-    st.markdown("""
-    <div class="chart-wrapper">
-    """, unsafe_allow_html=True)
-    
-    # Title and description
-    st.markdown(f"<div class='chart-title'>{title}</div>", unsafe_allow_html=True)
-    st.markdown(f"<div class='chart-description'>{description}</div>", unsafe_allow_html=True)
+    # Title/description and the footer each go out as one markdown element. Separate
+    # elements can't nest, so the old open/close chart-wrapper divs only ever drew
+    # an empty box above the title and are left out.
+    st.markdown(
+        f"<div class='chart-title'>{title}</div>"
+        f"<div class='chart-description'>{description}</div>",
+        unsafe_allow_html=True
+    )
     
     # Chart itself
-    st.altair_chart(chart_element, use_container_width=use_container_width)
-    
-    # Insights and tips footer
-    col1, col2 = st.columns([3, 1]) if interaction_tip else (st.columns([1]), None)
-    
-    with col1:
-        st.markdown(
-            f"<small><strong>Key Insight:</strong> {key_insight}</small>",
-            unsafe_allow_html=True
-        )
-    
-    if col2 and interaction_tip:
-        with col2:
-            st.markdown(
-                f"<small>{interaction_tip}</small>",
-                unsafe_allow_html=True
-            )
+    if isinstance(chart_element, dict):
+        st.vega_lite_chart(spec=chart_element, use_container_width=use_container_width)
+    else:
+        st.altair_chart(chart_element, use_container_width=use_container_width)
     
-    st.markdown("</div>", unsafe_allow_html=True)
+    # Insights and tips footer (3:1 split when there is a tip)
+    tip_html = (
+        f"<div style='flex: 1;'><small>{interaction_tip}</small></div>" if interaction_tip else ''
+    )
+    st.markdown(
+        f"<div style='display: flex; gap: 16px;'>"
+        f"<div style='flex: 3;'><small><strong>Key Insight:</strong> {key_insight}</small></div>"
+        f"{tip_html}</div>",
+        unsafe_allow_html=True
+    )
 
 
 def render_two_column_charts(
@@ -252,56 +311,31 @@ def render_two_column_charts(
         )
 
 
-def render_key_metrics(df_filtered):
-    """
-    Render the key metrics section - USED IN OVERVIEW PAGE.
-    Now uses consistent metric cards.
-    Only considers the specific 14 Bond films.
-    """
-    st.markdown("""
-    <style>
-    .metric-card {
-        background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%);
-        padding: 20px;
-        border-radius: 10px;
-        border-left: 4px solid #FFD700;
-        margin-bottom: 10px;
-        text-align: center;
-        min-height: 100px;
-    }
-    .metric-label {
-        font-size: 12px;
-        color: #999;
-        text-transform: uppercase;
-        letter-spacing: 1px;
-        margin-bottom: 8px;
-    }
-    .metric-value {
-        font-size: 28px;
-        font-weight: bold;
-        color: #FFD700;
-    }
-    </style>
-    """, unsafe_allow_html=True)
-    
-    render_section_header("Executive Metrics")
+def _truncate(text, max_len=20):
+    """Shorten ``text`` to ``max_len`` characters with a trailing ellipsis."""
+    return text if len(text) <= max_len else text[:max_len] + '...'
+
+
+@st.cache_data(show_spinner=False)
+def _key_metrics(fingerprint, _df_filtered):
+    """Metric card dicts for the 14 Bond films in the filtered rows, or None when there are none.
     
+    Keyed on ``fingerprint`` (the filtered row labels), so reruns with an unchanged
+    filter skip the film matching and reductions.
+    """
     # Filter to only specific Bond films
-    df_bond_films = filter_to_specific_bond_films(df_filtered)
+    df_bond_films = filter_to_specific_bond_films(_df_filtered)
     
     if df_bond_films.empty:
-        st.warning("No specific Bond films found in the filtered data.")
-        return
+        return None
     
     total_films = len(df_bond_films)
-    avg_rating = df_bond_films['averageRating'].mean() if total_films > 0 else 0
-    avg_runtime = df_bond_films['runtimeMinutes'].mean() if total_films > 0 else 0
-    best_film = df_bond_films.loc[df_bond_films['averageRating'].idxmax()] if total_films > 0 else {
-        'primaryTitle': 'N/A',
-        'averageRating': 0
-    }
+    ratings = df_bond_films['averageRating'].to_numpy()
+    avg_rating = ratings.mean()
+    avg_runtime = df_bond_films['runtimeMinutes'].to_numpy().mean()
+    best_film = df_bond_films.iloc[int(ratings.argmax())]
     
-    metrics = [
+    return [
         {
             'label': 'Total Films Analyzed',
             'value': str(total_films),
@@ -320,14 +354,36 @@ def render_key_metrics(df_filtered):
         {
             'label': 'Highest Rated Film',
             'value': f'{best_film["averageRating"]:.2f}/10',
-            'context': best_film['primaryTitle'][:20] + '...' if len(best_film['primaryTitle']) > 20 else best_film['primaryTitle']
+            'context': _truncate(best_film['primaryTitle'])
         }
     ]
+
+
+def render_key_metrics(df_filtered):
+    """
+    Render the key metrics section - USED IN OVERVIEW PAGE.
+    Now uses consistent metric cards.
+    Only considers the specific 14 Bond films.
+    """
+    render_section_header("Executive Metrics")
+    
+    metrics = _key_metrics(df_filtered.index.to_numpy(), df_filtered)
+    
+    if metrics is None:
+        st.warning("No specific Bond films found in the filtered data.")
+        return
     
     render_metrics_row(metrics)
     st.markdown("---")
 
 
+# df_full is the shared frame from load_and_preprocess_data, so identity is a sound cache key
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: id})
+def _bond_core_films(df_full):
+    """The is_bond_core rows of df_full with their actor categories pruned."""
+    return drop_unused_categories(df_full.iloc[np.flatnonzero(df_full['is_bond_core'].to_numpy())])
+
+
 def render_sidebar_filters(df_full):
     """
     Render sidebar filters and return filtered data.
@@ -345,9 +401,9 @@ def render_sidebar_filters(df_full):
     # Apply Focus Filter (defaulting to first option)
     # if data_focus == 'James Bond Core Films (EON Actors & 007 Titles)':
     data_focus = 'James Bond Core Films (EON Actors & 007 Titles)'  # Default value
-    df_current = df_full[df_full['is_bond_core']].copy()
-    actor_list_options = sorted(list(set(EON_BOND_ACTORS).intersection(df_current['leadActor'].unique())))
-    default_actors = EON_BOND_ACTORS
+    df_current = _bond_core_films(df_full)
+    actor_list_options = sorted(EON_BOND_ACTORS.intersection(df_current['leadActor'].cat.categories))
+    default_actors = EON_BOND_ACTORS_ORDERED
     # else:
     #     df_current = df_full.copy()
     #     top_actors = df_current.groupby('leadActor').filter(
@@ -356,23 +412,19 @@ def render_sidebar_filters(df_full):
     #     actor_list_options = sorted(top_actors['leadActor'].unique().tolist())
     #     default_actors = EON_BOND_ACTORS
 
-    st.sidebar.markdown("---")
-    st.sidebar.markdown("### Actor Dossier")
-
-    # 2. Vertical Checkbox Filter
-    selected_actors_dict = {}
-    for actor in actor_list_options:
-        is_selected = st.sidebar.checkbox(actor, value=(actor in default_actors))
-        selected_actors_dict[actor] = is_selected
+    st.sidebar.markdown("---\n### Actor Dossier")
 
-    selected_actors = [actor for actor, selected in selected_actors_dict.items() if selected]
+    # 2. Actor Filter (one widget for the whole selection)
+    selected_actors = st.sidebar.multiselect(
+        "Actors",
+        options=actor_list_options,
+        default=[actor for actor in default_actors if actor in actor_list_options]
+    )
 
-    st.sidebar.markdown("---")
-    st.sidebar.markdown("### Temporal Filter")
+    st.sidebar.markdown("---\n### Temporal Filter")
 
     # 3. Year Range Slider
-    year_min = int(df_current['releaseYear'].min()) if not df_current.empty else 1960
-    year_max = int(df_current['releaseYear'].max()) if not df_current.empty else 2025
+    year_min, year_max = df_full.attrs['year_bounds']['bond_core'] or (1960, 2025)
 
     if year_min < year_max:
         selected_years = st.sidebar.slider(
@@ -391,42 +443,18 @@ def render_sidebar_filters(df_full):
     if st.sidebar.button("Reset All Filters", use_container_width=True):
         st.rerun()
 
-    # Apply ALL Filters
+    # Apply ALL Filters (integer compares on actor codes and int32 years)
     if selected_actors and not df_current.empty:
-        df_filtered = df_current[
-            (df_current['leadActor'].isin(selected_actors)) &
-            (df_current['releaseYear'] >= selected_years[0]) &
-            (df_current['releaseYear'] <= selected_years[1])
-        ].copy()
+        actors = df_current['leadActor'].array
+        selected_codes = actors.categories.get_indexer(selected_actors)
+        years = df_current['releaseYear'].to_numpy()
+        mask = (
+            np.isin(actors.codes, selected_codes[selected_codes >= 0]) &
+            (years >= selected_years[0]) &
+            (years <= selected_years[1])
+        )
+        df_filtered = drop_unused_categories(df_current.iloc[np.flatnonzero(mask)])
     else:
         df_filtered = None
 
     return df_filtered, selected_actors
-
-
-def get_page_container_style():
-    """CSS for main page container - consistent page layout"""
-    return """
-    <style>
-    .page-container {
-        max-width: 1400px;
-        margin: 0 auto;
-        padding: 20px;
-        margin-top: -60px;
-    }
-    .page-title {
-        font-size: 36px;
-        font-weight: bold;
-        color: white;
-        margin-bottom: 8px;
-        text-align: center;
-        margin-top: 0;
-    }
-    .page-subtitle {
-        font-size: 16px;
-        color: #FFD700;
-        text-align: center;
-        margin-bottom: 20px;
-    }
-    </style>
-    """
\ No newline at end of file
@@ -13,12 +13,14 @@ ACCENT_GOLD = '#FFD700'
 GRID_COLOR = '#2C2C2C'
 
 # Define the set of Canonical Eon Bond Actors
-EON_BOND_ACTORS = [
+EON_BOND_ACTORS_ORDERED = (
     'Roger Moore', 
     'Timothy Dalton', 
     'Pierce Brosnan', 
     'Daniel Craig'
-]
+)
+# Set form for membership tests; use the ordered tuple wherever order matters
+EON_BOND_ACTORS = frozenset(EON_BOND_ACTORS_ORDERED)
 
 
 def get_bond_theme():
@@ -1,5 +1,7 @@
 """Data loading and preprocessing utilities."""
 
+import re
+
 import pandas as pd
 import numpy as np
 import streamlit as st
@@ -7,47 +9,170 @@ from pathlib import Path
 
 try:
     from .config import EON_BOND_ACTORS
+    from .charts import GENRE_COLUMNS, filter_to_specific_bond_films, narrow_chart_dtypes, create_bond_comparison_chart
 except ImportError:
     from config import EON_BOND_ACTORS
+    from charts import GENRE_COLUMNS, filter_to_specific_bond_films, narrow_chart_dtypes, create_bond_comparison_chart
 
 
-@st.cache_data
+# Filtered frames are handed to pages as views; copy-on-write makes any later write
+# copy lazily instead of every filter copying up front (always on from pandas 3)
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
+
+_BOND_TITLE_RE = re.compile(r'Bond|007', re.IGNORECASE)
+
+# Columns read anywhere in the dashboard; originalTitle is only needed for is_bond_core
+_KEEP_COLUMNS = [
+    'primaryTitle', 'leadActor', 'releaseYear', 'decade', 'runtimeMinutes',
+    'averageRating', 'numVotes', 'is_bond_core'
+] + GENRE_COLUMNS
+# Columns read from the CSV and the dtypes the reader can assign directly
+_CSV_COLUMNS = [col for col in _KEEP_COLUMNS if col not in ('decade', 'is_bond_core')] + ['originalTitle']
+_CSV_DTYPES = {
+    'releaseYear': np.int32,
+    'averageRating': np.float32,
+    'leadActor': 'category',
+    # 0/1 genre flags: a byte each instead of int64 makes genre sums move 8x less memory
+    **dict.fromkeys(GENRE_COLUMNS, np.uint8)
+}
+# numVotes and runtimeMinutes stay floating point: the data has fractional values in
+# both, and float32 holds them (and every vote count in the data) exactly
+_COLUMN_DTYPES = {
+    'averageRating': np.float32,
+    'numVotes': np.float32,
+    'runtimeMinutes': np.float32
+}
+
+
+# Bump whenever the preprocessing below changes so stale Parquet caches are ignored
+_PARQUET_CACHE_VERSION = 4
+
+
+def _parquet_cache_path(file_path):
+    """Location of the preprocessed Parquet copy stored next to the CSV."""
+    file_path = Path(file_path)
+    return file_path.with_name(f'{file_path.stem}.clean-v{_PARQUET_CACHE_VERSION}.parquet')
+
+
+@st.cache_resource
 def load_and_preprocess_data(file_path):
-    """Load and preprocess the Bond film dataset."""
-    df = pd.read_csv(file_path)
+    """Load and preprocess the Bond film dataset.
+    
+    Cached as a shared resource: every rerun gets the same read-only frame (no
+    per-rerun unpickling), so callers must not mutate it in place.
+    """
+    # Cold starts reuse the preprocessed Parquet copy while it is newer than the CSV
+    cache_path = _parquet_cache_path(file_path)
+    if cache_path.exists() and cache_path.stat().st_mtime >= Path(file_path).stat().st_mtime:
+        df = pd.read_parquet(cache_path)
+    else:
+        df = _preprocess_csv(file_path)
+        try:
+            df.to_parquet(cache_path, compression='zstd')
+        except OSError:
+            # Read-only data directory: keep serving from the CSV pipeline
+            pass
+    
+    # Slider bounds never change for a given file, so compute them once here
+    years = df['releaseYear'].to_numpy()
+    df.attrs['year_bounds'] = {
+        'all': _year_bounds(years),
+        'bond_core': _year_bounds(years[df['is_bond_core'].to_numpy()])
+    }
+    
+    return df
+
+
+def _year_bounds(years):
+    """(min, max) of a year array as ints, or None when it is empty."""
+    return (int(years.min()), int(years.max())) if len(years) else None
+
+
+def _preprocess_csv(file_path):
+    """Run the CSV clean/feature pipeline behind load_and_preprocess_data."""
+    # Multithreaded Arrow parser; only the needed columns, typed on read
+    df = pd.read_csv(file_path, engine='pyarrow', usecols=_CSV_COLUMNS, dtype=_CSV_DTYPES)
     
     # 1. Initial Cleaning: Drop rows with missing leadActor
     df.dropna(subset=['leadActor'], inplace=True)
     
-    # 2. Clean numeric columns - remove NaN, inf, and invalid values
-    numeric_cols = ['averageRating', 'numVotes', 'runtimeMinutes']
-    for col in numeric_cols:
-        if col in df.columns:
-            # Replace inf/-inf with NaN
-            df[col] = df[col].replace([np.inf, -np.inf], np.nan)
-            # Drop rows with NaN in critical numeric columns
-            df = df[df[col].notna()].copy()
-            # Ensure positive values for numVotes and runtimeMinutes
-            if col in ['numVotes', 'runtimeMinutes']:
-                df = df[df[col] > 0].copy()
-    
-    # 3. Convert types for cleaner analysis
-    df['releaseYear'] = df['releaseYear'].astype(int)
-    df['decade'] = (df['releaseYear'] // 10 * 10).astype(int)
+    # 2. Clean numeric columns - remove NaN, inf, and invalid values in one combined mask
+    numeric_cols = [col for col in ['averageRating', 'numVotes', 'runtimeMinutes'] if col in df.columns]
+    positive_cols = [col for col in ['numVotes', 'runtimeMinutes'] if col in numeric_cols]
+    values = df[numeric_cols].to_numpy(dtype=np.float64)
+    # Drop rows with NaN/inf in critical numeric columns
+    keep = np.isfinite(values).all(axis=1)
+    # Ensure positive values for numVotes and runtimeMinutes
+    keep &= (values[:, [numeric_cols.index(col) for col in positive_cols]] > 0).all(axis=1)
+    df = df.loc[keep]
+    
+    # 3. Derive decade (releaseYear/leadActor are already typed by the reader); int32
+    #    arithmetic on releaseYear keeps it int32
+    df['decade'] = df['releaseYear'] // 10 * 10
     
     # 4. Create the 'Core Bond' subset mask
-    is_bond_actor = df['leadActor'].isin(EON_BOND_ACTORS)
-    has_bond_title = df['primaryTitle'].str.contains('Bond|007', case=False, na=False) | \
-                     df['originalTitle'].str.contains('Bond|007', case=False, na=False)
+    primary_hit = df['primaryTitle'].str.contains(_BOND_TITLE_RE, na=False).to_numpy()
+    # originalTitle mostly repeats primaryTitle; only scan the rows where it can add a hit
+    scan_original = (df['originalTitle'] != df['primaryTitle']).to_numpy() & ~primary_hit
+    original_hit = np.zeros(len(df), dtype=bool)
+    original_hit[scan_original] = df['originalTitle'][scan_original].str.contains(_BOND_TITLE_RE, na=False).to_numpy()
     
-    df['is_bond_core'] = (is_bond_actor | has_bond_title)
+    df['is_bond_core'] = np.logical_or.reduce([
+        df['leadActor'].isin(EON_BOND_ACTORS).to_numpy(),
+        primary_hit,
+        original_hit
+    ])
     
-    # 5. Filter out entries with too few votes
-    df = df[df['numVotes'] >= 500].copy()
+    # 5. Filter out entries with too few votes, keeping only the columns the
+    #    dashboard reads in compact dtypes to shrink the cached frame
+    df = df.loc[df['numVotes'] >= 500, _KEEP_COLUMNS].astype(_COLUMN_DTYPES)
     
     return df
 
 
+# df_full is the shared frame from load_and_preprocess_data, so identity is a sound cache key
+@st.cache_resource(show_spinner=False, hash_funcs={pd.DataFrame: id})
+def get_specific_bond_films(df_full):
+    """The 14 target Bond films in ``df_full``, matched once within its is_bond_core rows.
+    
+    Shared like load_and_preprocess_data, so the returned frame is read-only.
+    """
+    # Every target's expected actor is an Eon Bond actor, so the core rows hold all matches
+    df_core = df_full.iloc[np.flatnonzero(df_full['is_bond_core'].to_numpy())]
+    return filter_to_specific_bond_films(df_core)
+
+
+@st.cache_data
+def load_bond_films(file_path):
+    """Load the 14 target Bond films with their display columns precomputed."""
+    bond_films = get_specific_bond_films(load_and_preprocess_data(file_path))
+    
+    if bond_films.empty:
+        return bond_films
+    
+    bond_films = bond_films.sort_values('releaseYear').reset_index(drop=True)
+    
+    # Axis labels and the average line never change, so build them once here
+    bond_films['title_short'] = bond_films['primaryTitle'] + ' (' + bond_films['releaseYear'].astype(str) + ')'
+    # Plain float: st.cache_data cannot serialize a numpy scalar in attrs
+    bond_films.attrs['avg_rating'] = float(bond_films['averageRating'].mean())
+    
+    # Narrow dtypes so the Arrow payload sent to the chart is as small as possible
+    bond_films = narrow_chart_dtypes(bond_films)
+    
+    return bond_films
+
+
+@st.cache_resource
+def load_bond_comparison(file_path):
+    """Build the Bond vs other thrillers chart and its two frames once per data file.
+    
+    Shared like load_and_preprocess_data, so the returned chart and frames are read-only.
+    """
+    return create_bond_comparison_chart(load_and_preprocess_data(file_path))
+
+
 def get_data_path():
     """Get the path to the data file."""
     BASE_DIR = Path(__file__).resolve().parent.parent
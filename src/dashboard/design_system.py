@@ -223,14 +223,21 @@ def get_page_container_style():
 # INJECTION FUNCTIONS - Use these to ensure consistency
 # ============================================================================
 
+# The style blocks are constant, so concatenate them once at import
+_GLOBAL_STYLES = "".join([
+    get_metric_card_style(),
+    get_section_header_style(),
+    get_insight_card_style(),
+    get_chart_wrapper_style(),
+    get_page_container_style()
+])
+
+
 def inject_global_styles():
     """Inject ALL design system styles into page"""
     import streamlit as st
-    st.markdown(get_metric_card_style(), unsafe_allow_html=True)
-    st.markdown(get_section_header_style(), unsafe_allow_html=True)
-    st.markdown(get_insight_card_style(), unsafe_allow_html=True)
-    st.markdown(get_chart_wrapper_style(), unsafe_allow_html=True)
-    st.markdown(get_page_container_style(), unsafe_allow_html=True)
+    # One markdown element for all style blocks instead of one delta per block
+    st.markdown(_GLOBAL_STYLES, unsafe_allow_html=True)
 
 
 # ============================================================================
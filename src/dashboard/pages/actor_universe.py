@@ -2,33 +2,266 @@
 
 import streamlit as st
 import altair as alt
+import numpy as np
 import pandas as pd
 
 try:
-    from ..config import ACCENT_GOLD, ACCENT_ORANGE, ACCENT_BLUE, ACCENT_RED
+    from ..config import ACCENT_GOLD, ACCENT_ORANGE, ACCENT_BLUE, ACCENT_RED, get_bond_theme
     from ..components import (
-        initialize_page_styles, 
         render_page_header, 
         render_section_header,
-        render_insight_row
+        render_insight_row,
+        render_page_footer
     )
-    from ..charts import filter_to_specific_bond_films
+    from ..charts import drop_unused_categories, downsample_for_chart
+    from ..data_loader import get_specific_bond_films
 except ImportError:
-    from config import ACCENT_GOLD, ACCENT_ORANGE, ACCENT_BLUE, ACCENT_RED
+    from config import ACCENT_GOLD, ACCENT_ORANGE, ACCENT_BLUE, ACCENT_RED, get_bond_theme
     from components import (
-        initialize_page_styles, 
         render_page_header, 
         render_section_header,
-        render_insight_row
+        render_insight_row,
+        render_page_footer
     )
-    from charts import filter_to_specific_bond_films
+    from charts import drop_unused_categories, downsample_for_chart
+    from data_loader import get_specific_bond_films
+
+
+_GENRE_COLUMNS = ['Action', 'Adventure', 'Thriller', 'Romance', 'Comedy', 'Drama', 'Sci-Fi']
+# Frozen colour scales, inlined into the specs as literals
+_GENRE_DOMAIN = tuple(_GENRE_COLUMNS)
+_GENRE_RANGE = (ACCENT_RED, ACCENT_BLUE, ACCENT_ORANGE, ACCENT_GOLD, '#7CFC00', '#9B59B6', '#95A5A6')
+_FILM_TYPE_DOMAIN = ('James Bond Films', 'Other Films')
+_FILM_TYPE_RANGE = (ACCENT_RED, ACCENT_BLUE)
+
+# Charts on this page are plain Vega-Lite dicts: they skip Altair's schema validation
+# and to_dict() on every rerun, so the registered theme config is attached by hand
+_THEME_CONFIG = get_bond_theme()['config']
+
+
+# Specs depend only on the actor's scalars; st.cache_data hands back a fresh copy per
+# rerun, so Streamlit can adjust the dict without touching the cached one
+@st.cache_data(show_spinner=False)
+def _donut_spec(actor):
+    """Vega-Lite spec for the genre donut with the actor's name in the centre."""
+    return {
+        '$schema': alt.SCHEMA_URL,
+        'title': f"Genre Distribution in {actor}'s Filmography",
+        'height': 400,
+        'layer': [
+            {
+                'mark': {'type': 'arc', 'innerRadius': 80, 'outerRadius': 140},
+                'encoding': {
+                    'theta': {'field': 'Count', 'type': 'quantitative'},
+                    'color': {
+                        'field': 'Genre', 'type': 'nominal', 'title': 'Genre',
+                        'scale': {'domain': _GENRE_DOMAIN, 'range': _GENRE_RANGE}
+                    },
+                    'tooltip': [
+                        {'field': 'Genre', 'type': 'nominal'},
+                        {'field': 'Count', 'type': 'quantitative'}
+                    ]
+                }
+            },
+            {
+                'data': {'values': [{'text': actor}]},
+                'mark': {
+                    'type': 'text', 'size': 20, 'fontWeight': 'bold', 'color': ACCENT_GOLD,
+                    'align': 'center', 'baseline': 'middle'
+                },
+                'encoding': {'text': {'field': 'text', 'type': 'nominal'}}
+            }
+        ],
+        'config': {**_THEME_CONFIG, 'view': {**_THEME_CONFIG['view'], 'strokeWidth': 0}}
+    }
+
+
+@st.cache_data(show_spinner=False)
+def _career_arc_spec(avg_rating, last_year):
+    """Vega-Lite spec for the rating scatter with the career-average rule and label."""
+    return {
+        '$schema': alt.SCHEMA_URL,
+        'height': 350,
+        'layer': [
+            {
+                'mark': {'type': 'circle', 'size': 120, 'opacity': 0.8},
+                'encoding': {
+                    'x': {
+                        'field': 'releaseYear', 'type': 'ordinal', 'title': 'Release Year',
+                        'axis': {'labelAngle': 0}
+                    },
+                    'y': {
+                        'field': 'averageRating', 'type': 'quantitative', 'title': 'IMDb Rating',
+                        'scale': {'domain': [3, 10]}
+                    },
+                    'color': {
+                        'field': 'film_type', 'type': 'nominal',
+                        'scale': {'domain': _FILM_TYPE_DOMAIN, 'range': _FILM_TYPE_RANGE},
+                        'legend': {'title': 'Film Type', 'orient': 'bottom-right'}
+                    },
+                    'tooltip': [
+                        {'field': 'primaryTitle', 'type': 'nominal'},
+                        {'field': 'releaseYear', 'type': 'quantitative'},
+                        {'field': 'averageRating', 'type': 'quantitative', 'format': '.2f'},
+                        {'field': 'film_type', 'type': 'nominal'}
+                    ]
+                }
+            },
+            {
+                'data': {'values': [{'avg': avg_rating}]},
+                'mark': {'type': 'rule', 'color': ACCENT_GOLD, 'strokeDash': [5, 5], 'size': 2},
+                'encoding': {'y': {'field': 'avg', 'type': 'quantitative'}}
+            },
+            {
+                'data': {'values': [{
+                    'x': last_year, 'y': avg_rating, 'text': f'Career Avg: {avg_rating:.2f}'
+                }]},
+                'mark': {
+                    'type': 'text', 'align': 'right', 'baseline': 'bottom', 'dx': -5, 'dy': -5,
+                    'color': ACCENT_GOLD, 'fontSize': 11, 'fontWeight': 'bold'
+                },
+                'encoding': {
+                    'x': {'field': 'x', 'type': 'ordinal'},
+                    'y': {'field': 'y', 'type': 'quantitative'},
+                    'text': {'field': 'text', 'type': 'nominal'}
+                }
+            }
+        ],
+        'config': _THEME_CONFIG
+    }
+
+
+@st.cache_data(show_spinner=False)
+def _rankings_spec():
+    """Vega-Lite spec for the top-15 films bar chart."""
+    return {
+        '$schema': alt.SCHEMA_URL,
+        'title': 'Top 15 Films by Rating',
+        'height': 400,
+        'mark': {'type': 'bar'},
+        'encoding': {
+            'y': {
+                'field': 'Film (Year)', 'type': 'nominal', 'sort': '-x', 'title': None,
+                'axis': {'labelLimit': 300}
+            },
+            'x': {
+                'field': 'averageRating', 'type': 'quantitative', 'title': 'IMDb Rating',
+                'scale': {'domain': [0, 10]}
+            },
+            'color': {
+                'field': 'averageRating', 'type': 'quantitative',
+                'scale': {'domain': [5, 10], 'range': [ACCENT_ORANGE, ACCENT_BLUE]},
+                'legend': None
+            },
+            'tooltip': [
+                {'field': 'primaryTitle', 'type': 'nominal'},
+                {'field': 'releaseYear', 'type': 'quantitative'},
+                {'field': 'averageRating', 'type': 'quantitative', 'format': '.2f'}
+            ]
+        },
+        'config': _THEME_CONFIG
+    }
+
+
+# df_full is the shared frame from load_and_preprocess_data, so identity is a sound cache key
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: id})
+def _actor_positions(df_full, actors):
+    """Row positions of each actor's films in df_full, from integer compares on the category codes."""
+    leads = df_full['leadActor'].array
+    codes = leads.categories.get_indexer(list(actors))
+    return {actor: np.flatnonzero(leads.codes == code) for actor, code in zip(actors, codes) if code >= 0}
+
+
+def _all_actor_positions(df_full, actors):
+    """Sorted row positions of every film led by one of ``actors``."""
+    positions = list(_actor_positions(df_full, actors).values())
+    return np.sort(np.concatenate(positions)) if positions else np.empty(0, dtype=np.intp)
+
+
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: id})
+def _actor_slice(df_full, actor, actors):
+    """Films led by ``actor``, flagged by whether each is one of the specific Bond films."""
+    positions = _actor_positions(df_full, actors).get(actor, np.empty(0, dtype=np.intp))
+    df_actor = drop_unused_categories(df_full.iloc[positions])
+    
+    # Get the specific Bond films for this actor
+    df_specific_bond_films = get_specific_bond_films(df_full)
+    bond_film_titles = set(df_specific_bond_films[df_specific_bond_films['leadActor'] == actor]['primaryTitle'].values)
+    
+    # Identify Bond films vs other films for this actor
+    is_specific_bond = df_actor['primaryTitle'].isin(bond_film_titles).to_numpy()
+    return df_actor.assign(
+        is_specific_bond=is_specific_bond,
+        # Two-value label as a category: one code per row instead of a string each
+        film_type=pd.Categorical.from_codes((~is_specific_bond).astype(np.int8), categories=_FILM_TYPE_DOMAIN)
+    )
+
+
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: id})
+def _actor_genre_sums(df_full, actors):
+    """Genre film counts for every actor in ``actors`` from one grouped sum."""
+    df_actors = df_full.iloc[_all_actor_positions(df_full, actors)][['leadActor'] + _GENRE_COLUMNS]
+    return df_actors.groupby('leadActor', observed=True)[_GENRE_COLUMNS].sum()
+
+
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: id})
+def _actor_genres(df_full, actor, actors):
+    """Non-zero genre counts for ``actor``, largest first."""
+    df_genre = _actor_genre_sums(df_full, actors).loc[actor].rename('Count').rename_axis('Genre').reset_index()
+    return df_genre[df_genre['Count'] > 0].sort_values('Count', ascending=False)
+
+
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: id})
+def _actor_rankings(df_full, actor, actors, top_n=15):
+    """``actor``'s ``top_n`` best-rated films with a 'Film (Year)' label column."""
+    df_top = _actor_slice(df_full, actor, actors).nlargest(top_n, 'averageRating', keep='first')
+    df_top = df_top[['primaryTitle', 'releaseYear', 'averageRating']]
+    # Only top_n labels are needed, so a plain comprehension beats Series string ops
+    return df_top.assign(**{'Film (Year)': [
+        f"{title} ({year})" for title, year in zip(df_top['primaryTitle'].tolist(), df_top['releaseYear'].tolist())
+    ]})
+
+
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: id})
+def _actor_stats(df_full, actors):
+    """Quick-stat figures for every actor in ``actors`` from one grouped pass."""
+    df_actors = df_full.iloc[_all_actor_positions(df_full, actors)]
+    
+    # Flag each actor's specific Bond films by (actor, title) pair
+    df_specific_bond_films = get_specific_bond_films(df_full)
+    bond_keys = pd.MultiIndex.from_arrays([
+        df_specific_bond_films['leadActor'].astype(str), df_specific_bond_films['primaryTitle']
+    ])
+    is_specific_bond = pd.MultiIndex.from_arrays([
+        df_actors['leadActor'].astype(str), df_actors['primaryTitle']
+    ]).isin(bond_keys)
+    
+    grouped = df_actors.assign(is_specific_bond=is_specific_bond).groupby('leadActor', observed=True).agg(
+        bond=('is_specific_bond', 'sum'),
+        total=('is_specific_bond', 'size'),
+        avg=('averageRating', 'mean'),
+        last_year=('releaseYear', 'max'),
+        best_idx=('averageRating', 'idxmax'),
+        worst_idx=('averageRating', 'idxmin')
+    )
+    
+    film_cols = ['primaryTitle', 'releaseYear', 'averageRating']
+    return {
+        actor: {
+            'bond': int(row.bond),
+            'other': int(row.total - row.bond),
+            'avg': float(row.avg),
+            'last_year': int(row.last_year),
+            'best_film': df_full.loc[row.best_idx, film_cols].to_dict(),
+            'worst_film': df_full.loc[row.worst_idx, film_cols].to_dict()
+        }
+        for actor, row in grouped.iterrows()
+    }
 
 
 def render_actor_universe(df_full, EON_BOND_ACTORS):
     """Render the Actor Universe page with professional design system."""
     
-    initialize_page_styles()
-    
     render_page_header(
         "Across the 007 Verse",
         "Comparative Analysis of All Bond Actors"
@@ -38,10 +271,10 @@ def render_actor_universe(df_full, EON_BOND_ACTORS):
     Fans often debate over who's the best **James Bond** — Daniel Craig, 
     Pierce Brosnan, Roger Moore, or Timothy Dalton.  
     Within this data story, you have the opportunity to compare their works, performance, and legacy.
+    
+    ---
     """)
 
-    st.markdown("---")
-
     # ========================================================================
     # ACTOR SELECTION
     # ========================================================================
@@ -56,34 +289,24 @@ def render_actor_universe(df_full, EON_BOND_ACTORS):
             label_visibility="collapsed"
         )
 
-    df_actor = df_full[df_full['leadActor'] == selected_actor].copy()
+    bond_actors = tuple(EON_BOND_ACTORS)
+    df_actor = _actor_slice(df_full, selected_actor, bond_actors)
 
     if df_actor.empty:
         st.warning(f"No films found for {selected_actor}.")
         return
-
-    # Get the specific Bond films for this actor
-    df_specific_bond_films = filter_to_specific_bond_films(df_full)
-    bond_film_titles = set(df_specific_bond_films[df_specific_bond_films['leadActor'] == selected_actor]['primaryTitle'].values)
-    
-    # Identify Bond films vs other films for this actor
-    df_actor['is_specific_bond'] = df_actor['primaryTitle'].isin(bond_film_titles)
     
     st.markdown("---")
 
     # ========================================================================
     # QUICK STATS
     # ========================================================================
-    bond_count = df_actor[df_actor['is_specific_bond']].shape[0]
-    other_count = df_actor[~df_actor['is_specific_bond']].shape[0]
-    
-    # Calculate average rating for Bond films and other films separately
-    bond_avg_rating = df_actor[df_actor['is_specific_bond']]['averageRating'].mean() if bond_count > 0 else 0
-    other_avg_rating = df_actor[~df_actor['is_specific_bond']]['averageRating'].mean() if other_count > 0 else 0
-    avg_rating = df_actor['averageRating'].mean()
-    
-    best_film = df_actor.loc[df_actor['averageRating'].idxmax()]
-    worst_film = df_actor.loc[df_actor['averageRating'].idxmin()]
+    actor_stats = _actor_stats(df_full, bond_actors)[selected_actor]
+    bond_count = actor_stats['bond']
+    other_count = actor_stats['other']
+    avg_rating = actor_stats['avg']
+    best_film = actor_stats['best_film']
+    worst_film = actor_stats['worst_film']
 
     render_insight_row([
         {
@@ -110,31 +333,9 @@ def render_actor_universe(df_full, EON_BOND_ACTORS):
     # ========================================================================
     render_section_header(f"Genre Mastery: {selected_actor}")
     
-    genre_cols = ['Action', 'Adventure', 'Thriller', 'Romance', 'Comedy', 'Drama', 'Sci-Fi']
-    df_genre = df_actor[genre_cols].sum().reset_index()
-    df_genre.columns = ['Genre', 'Count']
-    df_genre = df_genre[df_genre['Count'] > 0].sort_values('Count', ascending=False)
-
-    donut_chart = alt.Chart(df_genre).mark_arc(innerRadius=80, outerRadius=140).encode(
-        theta=alt.Theta('Count:Q'),
-        color=alt.Color('Genre:N', 
-                       scale=alt.Scale(
-                           domain=['Action', 'Adventure', 'Thriller', 'Romance', 'Comedy', 'Drama', 'Sci-Fi'],
-                           range=[ACCENT_RED, ACCENT_BLUE, ACCENT_ORANGE, ACCENT_GOLD, '#7CFC00', '#9B59B6', '#95A5A6']
-                       ),
-                       title='Genre'),
-        tooltip=['Genre', 'Count']
-    )
-    
-    center_text = alt.Chart(pd.DataFrame({'text': [selected_actor]})).mark_text(
-        size=20, fontWeight='bold', color=ACCENT_GOLD, align='center', baseline='middle'
-    ).encode(text='text:N')
-    
-    final_chart = alt.layer(donut_chart, center_text).properties(
-        height=400, title=f"Genre Distribution in {selected_actor}'s Filmography"
-    ).configure_view(strokeWidth=0)
+    df_genre = _actor_genres(df_full, selected_actor, bond_actors)
 
-    st.altair_chart(final_chart, use_container_width=True)
+    st.vega_lite_chart(df_genre, _donut_spec(selected_actor), use_container_width=True)
 
     st.markdown("---")
 
@@ -143,37 +344,11 @@ def render_actor_universe(df_full, EON_BOND_ACTORS):
     # ========================================================================
     render_section_header(f"Career Arc: {selected_actor}'s Evolution")
     
-    avg_actor_rating = df_actor['averageRating'].mean()
-    
-    df_actor_viz = df_actor.copy()
-    df_actor_viz['film_type'] = df_actor_viz['is_specific_bond'].apply(
-        lambda x: 'James Bond Films' if x else 'Other Films'
+    st.vega_lite_chart(
+        downsample_for_chart(df_actor[['primaryTitle', 'releaseYear', 'averageRating', 'film_type']]),
+        _career_arc_spec(avg_rating, actor_stats['last_year']),
+        use_container_width=True
     )
-    
-    scatter_chart = alt.Chart(df_actor_viz).mark_circle(size=120, opacity=0.8).encode(
-        x=alt.X('releaseYear:O', title="Release Year", axis=alt.Axis(labelAngle=0)),
-        y=alt.Y('averageRating:Q', title="IMDb Rating", scale=alt.Scale(domain=[3, 10])),
-        color=alt.Color('film_type:N',
-            scale=alt.Scale(domain=['James Bond Films', 'Other Films'], range=[ACCENT_RED, ACCENT_BLUE]),
-            legend=alt.Legend(title="Film Type", orient="bottom-right")
-        ),
-        tooltip=['primaryTitle', 'releaseYear', alt.Tooltip('averageRating', format=".2f"), 'film_type']
-    ).properties(height=350)
-    
-    avg_line = alt.Chart(pd.DataFrame({'avg': [avg_actor_rating]})).mark_rule(
-        color=ACCENT_GOLD, strokeDash=[5, 5], size=2
-    ).encode(y='avg:Q')
-    
-    avg_text = alt.Chart(pd.DataFrame({
-        'x': [df_actor['releaseYear'].max()],
-        'y': [avg_actor_rating],
-        'text': [f'Career Avg: {avg_actor_rating:.2f}']
-    })).mark_text(
-        align='right', baseline='bottom', dx=-5, dy=-5,
-        color=ACCENT_GOLD, fontSize=11, fontWeight='bold'
-    ).encode(x='x:O', y='y:Q', text='text:N')
-    
-    st.altair_chart(scatter_chart + avg_line + avg_text, use_container_width=True)
 
     st.markdown("---")
 
@@ -182,23 +357,10 @@ def render_actor_universe(df_full, EON_BOND_ACTORS):
     # ========================================================================
     render_section_header("⭐", f"Filmography Rankings: {selected_actor}")
     
-    df_sorted = df_actor.sort_values(by='averageRating', ascending=False).copy()
-    df_sorted['Film (Year)'] = df_sorted['primaryTitle'] + " (" + df_sorted['releaseYear'].astype(str) + ")"
-    
     # Show top 15 films
-    df_top = df_sorted.head(15)
-
-    rating_chart = alt.Chart(df_top).mark_bar().encode(
-        y=alt.Y('Film (Year):N', sort='-x', title=None, axis=alt.Axis(labelLimit=300)),
-        x=alt.X('averageRating:Q', title="IMDb Rating", scale=alt.Scale(domain=[0, 10])),
-        color=alt.Color('averageRating:Q',
-            scale=alt.Scale(domain=[5, 10], range=[ACCENT_ORANGE, ACCENT_BLUE]), 
-            legend=None
-        ),
-        tooltip=['primaryTitle', 'releaseYear', alt.Tooltip('averageRating', format=".2f")]
-    ).properties(height=400, title=f"Top 15 Films by Rating")
+    df_top = _actor_rankings(df_full, selected_actor, bond_actors, top_n=15)
 
-    st.altair_chart(rating_chart, use_container_width=True)
+    st.vega_lite_chart(df_top, _rankings_spec(), use_container_width=True)
 
     # Best and Worst films
     col1, col2 = st.columns(2)
@@ -226,11 +388,8 @@ def render_actor_universe(df_full, EON_BOND_ACTORS):
     # ========================================================================
     # FOOTER
     # ========================================================================
-    st.markdown("""
-    <div style="text-align: center; color: #666; margin-top: 40px; padding: 20px; border-top: 1px solid #333;">
-        <small>
-        <strong>Actor Universe</strong> | Individual Actor Analysis | 007 Data Dossier<br>
-        <em>Data Source: IMDb | Analysis: November 2025</em>
-        </small>
-    </div>
-    """, unsafe_allow_html=True)
\ No newline at end of file
+    render_page_footer(
+        "Actor Universe",
+        "Individual Actor Analysis | 007 Data Dossier",
+        "Data Source: IMDb | Analysis: November 2025"
+    )
\ No newline at end of file
@@ -1,14 +1,12 @@
 """Individual Charts page - focused chart views."""
 
 import streamlit as st
-import pandas as pd
 
 try:
-    from ..components import render_sidebar_filters
+    from ..components import render_sidebar_filters, cached_chart_spec
     from ..charts import (
         create_actor_performance_chart,
         create_rating_trend_chart,
-        create_bond_comparison_chart,
         create_bond_films_rating_chart,
         create_runtime_rating_chart,
         create_genre_evolution_chart,
@@ -19,12 +17,12 @@ try:
         create_engagement_boxplot,
         create_film_timeline_chart
     )
+    from ..data_loader import load_bond_films, load_bond_comparison, get_data_path
 except ImportError:
-    from components import render_sidebar_filters
+    from components import render_sidebar_filters, cached_chart_spec
     from charts import (
         create_actor_performance_chart,
         create_rating_trend_chart,
-        create_bond_comparison_chart,
         create_bond_films_rating_chart,
         create_runtime_rating_chart,
         create_genre_evolution_chart,
@@ -35,6 +33,7 @@ except ImportError:
         create_engagement_boxplot,
         create_film_timeline_chart
     )
+    from data_loader import load_bond_films, load_bond_comparison, get_data_path
 
 
 def render_individual_chart(df_full, chart_name):
@@ -49,14 +48,21 @@ def render_individual_chart(df_full, chart_name):
         st.error("Please select at least one actor")
         return
     
-    # Render the selected chart
+    # Render the selected chart; specs share the overview's cache entries, keyed on the
+    # same filter fingerprint
+    fingerprint = df_filtered.index.to_numpy()
     if chart_name == "Actor Performance Ranking":
-        st.altair_chart(create_actor_performance_chart(df_filtered), use_container_width=True)
+        st.vega_lite_chart(
+            spec=cached_chart_spec('actor_performance', fingerprint, create_actor_performance_chart, df_filtered),
+            use_container_width=True
+        )
     
     elif chart_name == "Rating Trend Over Time":
-        chart = create_bond_films_rating_chart(df_full)
-        if chart:
-            st.altair_chart(chart, use_container_width=True)
+        spec = cached_chart_spec(
+            'bond_films_rating', None, create_bond_films_rating_chart, load_bond_films(get_data_path())
+        )
+        if spec:
+            st.vega_lite_chart(spec=spec, use_container_width=True)
         else:
             st.info("No Bond films found in the dataset")
     
@@ -64,8 +70,11 @@ def render_individual_chart(df_full, chart_name):
         st.markdown("#### James Bond Movies vs Other Thriller Films")
         st.caption("All Bond films compared to thriller movies with trend lines")
         
-        chart, bond_data, other_data = create_bond_comparison_chart(df_full)
-        st.altair_chart(chart, use_container_width=True)
+        chart, bond_data, other_data = load_bond_comparison(get_data_path())
+        st.vega_lite_chart(
+            spec=cached_chart_spec('bond_comparison', None, lambda chart: chart, chart),
+            use_container_width=True
+        )
         
         col1, col2 = st.columns(2)
         with col1:
@@ -82,7 +91,10 @@ def render_individual_chart(df_full, chart_name):
             """)
     
     elif chart_name == "Runtime vs Rating Analysis":
-        st.altair_chart(create_runtime_rating_chart(df_filtered), use_container_width=True)
+        st.vega_lite_chart(
+            spec=cached_chart_spec('runtime_rating', fingerprint, create_runtime_rating_chart, df_filtered),
+            use_container_width=True
+        )
     
     # elif chart_name == "Genre Evolution by Decade":
     #     st.altair_chart(create_genre_evolution_chart(df_filtered), use_container_width=True)
@@ -95,16 +107,31 @@ def render_individual_chart(df_full, chart_name):
     #         st.info("Not enough data to show genre trends")
     
     elif chart_name == "Rating Distribution by Actor":
-        st.altair_chart(create_rating_distribution_chart(df_filtered), use_container_width=True)
+        st.vega_lite_chart(
+            spec=cached_chart_spec('rating_distribution', fingerprint, create_rating_distribution_chart, df_filtered),
+            use_container_width=True
+        )
     
     elif chart_name == "Production Volume by Decade":
-        st.altair_chart(create_production_volume_chart(df_filtered), use_container_width=True)
+        st.vega_lite_chart(
+            spec=cached_chart_spec('production_volume', fingerprint, create_production_volume_chart, df_filtered),
+            use_container_width=True
+        )
     
     elif chart_name == "Performance Heatmap":
-        st.altair_chart(create_performance_heatmap(df_filtered), use_container_width=True)
+        st.vega_lite_chart(
+            spec=cached_chart_spec('performance_heatmap', fingerprint, create_performance_heatmap, df_filtered),
+            use_container_width=True
+        )
     
     elif chart_name == "Audience Engagement Distribution":
-        st.altair_chart(create_engagement_boxplot(df_filtered), use_container_width=True)
+        st.vega_lite_chart(
+            spec=cached_chart_spec('engagement_boxplot', fingerprint, create_engagement_boxplot, df_filtered),
+            use_container_width=True
+        )
     
     elif chart_name == "Complete Film Timeline":
-        st.altair_chart(create_film_timeline_chart(df_filtered), use_container_width=True)
+        st.vega_lite_chart(
+            spec=cached_chart_spec('film_timeline', fingerprint, create_film_timeline_chart, df_filtered),
+            use_container_width=True
+        )
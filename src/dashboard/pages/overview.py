@@ -4,7 +4,6 @@ import streamlit as st
 from charts import (
     create_actor_performance_chart,
     create_rating_distribution_chart,
-    create_bond_comparison_chart,
     create_runtime_rating_chart,
     create_genre_evolution_chart,
     create_production_volume_chart,
@@ -15,20 +14,69 @@ from charts import (
     create_film_timeline_chart,
     create_bond_films_rating_chart
 )
+from data_loader import load_bond_films, load_bond_comparison, get_data_path
 from components import (
-    initialize_page_styles,
     render_page_header,
     render_section_header,
     render_key_metrics,
     render_insight_row,
     render_chart_with_description,
-    render_two_column_charts
+    render_two_column_charts,
+    render_page_footer,
+    cached_chart_spec
 )
 
-try:
-    from ..config import ACCENT_GOLD, ACCENT_ORANGE, ACCENT_BLUE, ACCENT_RED
-except ImportError:
-    from config import ACCENT_GOLD, ACCENT_ORANGE, ACCENT_BLUE, ACCENT_RED
+
+# Opening or closing an expander only reruns this fragment, not the whole overview
+@st.fragment
+def _render_advanced_analytics(df_filtered, fingerprint):
+    """Render the collapsible Advanced Analytics charts."""
+    # The expanders track their open state, so each chart is only built once opened
+    
+    # Performance Heatmap
+    with st.expander(
+        "Performance Heatmap - Actor Performance by Decade", expanded=False,
+        key='exp_heatmap_open', on_change='rerun'
+    ) as expander:
+        if expander.open:
+            render_chart_with_description(
+                title='Performance Heatmap',
+                description='Heatmap showing average ratings for each actor in each decade they were active. '
+                           'Darker blue indicates higher ratings.',
+                key_insight='Which actor-decade combinations had the best critical reception? Any performance dips?',
+                chart_element=cached_chart_spec('performance_heatmap', fingerprint, create_performance_heatmap, df_filtered),
+                interaction_tip='Hover for exact ratings and film counts'
+            )
+    
+    # Audience Engagement
+    with st.expander(
+        "Audience Engagement Distribution", expanded=False,
+        key='exp_engagement_open', on_change='rerun'
+    ) as expander:
+        if expander.open:
+            render_chart_with_description(
+                title='Audience Engagement Boxplot',
+                description='Box plot showing the distribution of audience votes (popularity) for each actor. '
+                           'The box shows the middle 50% of data.',
+                key_insight='Which actors have the most engaged audiences? Which films are outliers?',
+                chart_element=cached_chart_spec('engagement_boxplot', fingerprint, create_engagement_boxplot, df_filtered),
+                interaction_tip='Hover for detailed statistics'
+            )
+    
+    # Complete Timeline
+    with st.expander(
+        "Complete Film Timeline", expanded=False,
+        key='exp_timeline_open', on_change='rerun'
+    ) as expander:
+        if expander.open:
+            render_chart_with_description(
+                title='Film Timeline Analysis',
+                description='Comprehensive view of all films plotted by release year and actor. '
+                           'Circle size represents popularity, color represents rating band.',
+                key_insight='Can you spot patterns in film quality over time? Which periods were most prolific?',
+                chart_element=cached_chart_spec('film_timeline', fingerprint, create_film_timeline_chart, df_filtered),
+                interaction_tip='Hover for film titles and ratings'
+            )
 
 
 def render_dashboard(df_full, df_filtered):
@@ -37,13 +85,14 @@ def render_dashboard(df_full, df_filtered):
     All components aligned to consistent sizing, spacing, and styling.
     """
     
-    # Initialize design system styles
-    initialize_page_styles()
-    
     if df_filtered is None or df_filtered.empty:
         st.warning("No data matches your filters. Please adjust your selection.")
         return
     
+    # df_filtered is always a row subset of the shared df_full, so its row labels
+    # identify it; charts for an unchanged filter skip Altair entirely
+    fingerprint = df_filtered.index.to_numpy()
+    
     # ========================================================================
     # SECTION 1: PAGE HEADER
     # ========================================================================
@@ -70,7 +119,9 @@ def render_dashboard(df_full, df_filtered):
         title='Bond Films Rating',
         description='Visualize the IMDb ratings for James Bond films only, color-coded by the actor who played Bond in each film.',
         key_insight='Which Bond actor had the highest-rated films? Are there patterns in ratings across different Bond eras?',
-        chart_element=create_bond_films_rating_chart(df_full),
+        chart_element=cached_chart_spec(
+            'bond_films_rating', None, create_bond_films_rating_chart, load_bond_films(get_data_path())
+        ),
         interaction_tip='Hover for film titles and details'
     )
     
@@ -104,17 +155,18 @@ def render_dashboard(df_full, df_filtered):
         "How do Bond films compare to other thriller movies?"
     )
     
+    bond_comp_chart, bond_df, other_df = load_bond_comparison(get_data_path())
+    
     render_chart_with_description(
         title='Bond Films vs Other Thrillers',
         description='Compare James Bond films with other thriller films using popularity (votes) on X-axis '
                    'and IMDb rating on Y-axis. Red circles are Bond films, gray circles are other thrillers.',
         key_insight='Do Bond films consistently outperform other thrillers in both rating and popularity?',
-        chart_element=create_bond_comparison_chart(df_full)[0],
+        chart_element=cached_chart_spec('bond_comparison', None, lambda chart: chart, bond_comp_chart),
         interaction_tip='Hover for detailed film information'
     )
     
     # Quick comparison insights
-    bond_comp_chart, bond_df, other_df = create_bond_comparison_chart(df_full)
     if not bond_df.empty and not other_df.empty:
         bond_avg = bond_df['averageRating'].mean()
         other_avg = other_df['averageRating'].mean()
@@ -155,7 +207,7 @@ def render_dashboard(df_full, df_filtered):
             'description': 'Explore the relationship between film length and critical reception. '
                           'Bubble size represents popularity (number of votes).',
             'key_insight': 'Is there an optimal runtime for Bond films? Do longer films get better ratings?',
-            'chart': create_runtime_rating_chart(df_filtered),
+            'chart': cached_chart_spec('runtime_rating', fingerprint, create_runtime_rating_chart, df_filtered),
             'interaction_tip': 'Hover for film details'
         },
         right_chart_config={
@@ -163,7 +215,7 @@ def render_dashboard(df_full, df_filtered):
             'description': 'Shows how many Bond films were produced in each decade. '
                           'Reveals the frequency and intensity of franchise activity.',
             'key_insight': 'In which decade were most Bond films released? Are there gaps in production?',
-            'chart': create_production_volume_chart(df_filtered),
+            'chart': cached_chart_spec('production_volume', fingerprint, create_production_volume_chart, df_filtered),
             'interaction_tip': 'Hover for exact counts'
         }
     )
@@ -213,7 +265,7 @@ def render_dashboard(df_full, df_filtered):
             'description': 'Ranks each Bond actor by their average IMDb rating across all films. '
                           'Higher ratings indicate stronger critical reception.',
             'key_insight': 'Which actor has the highest critical reception? Notice correlations between film count and ratings.',
-            'chart': create_actor_performance_chart(df_filtered),
+            'chart': cached_chart_spec('actor_performance', fingerprint, create_actor_performance_chart, df_filtered),
             'interaction_tip': 'Hover to see film counts'
         },
         right_chart_config={
@@ -221,7 +273,7 @@ def render_dashboard(df_full, df_filtered):
             'description': 'Visualizes the spread of ratings for each actor\'s films. '
                           'The red line shows the average rating.',
             'key_insight': 'Which actors have the most consistent ratings? Are there outliers?',
-            'chart': create_rating_distribution_chart(df_filtered),
+            'chart': cached_chart_spec('rating_distribution', fingerprint, create_rating_distribution_chart, df_filtered),
             'interaction_tip': 'Hover for film titles'
         }
     )
@@ -236,55 +288,15 @@ def render_dashboard(df_full, df_filtered):
         "Explore detailed performance heatmaps and engagement metrics"
     )
     
-    # Performance Heatmap
-    with st.expander("Performance Heatmap - Actor Performance by Decade", expanded=False):
-        render_chart_with_description(
-            title='Performance Heatmap',
-            description='Heatmap showing average ratings for each actor in each decade they were active. '
-                       'Darker blue indicates higher ratings.',
-            key_insight='Which actor-decade combinations had the best critical reception? Any performance dips?',
-            chart_element=create_performance_heatmap(df_filtered),
-            interaction_tip='Hover for exact ratings and film counts'
-        )
-    
-    # Audience Engagement
-    with st.expander("Audience Engagement Distribution", expanded=False):
-        render_chart_with_description(
-            title='Audience Engagement Boxplot',
-            description='Box plot showing the distribution of audience votes (popularity) for each actor. '
-                       'The box shows the middle 50% of data.',
-            key_insight='Which actors have the most engaged audiences? Which films are outliers?',
-            chart_element=create_engagement_boxplot(df_filtered),
-            interaction_tip='Hover for detailed statistics'
-        )
-    
-    # Complete Timeline
-    with st.expander("Complete Film Timeline", expanded=False):
-        render_chart_with_description(
-            title='Film Timeline Analysis',
-            description='Comprehensive view of all films plotted by release year and actor. '
-                       'Circle size represents popularity, color represents rating band.',
-            key_insight='Can you spot patterns in film quality over time? Which periods were most prolific?',
-            chart_element=create_film_timeline_chart(df_filtered),
-            interaction_tip='Hover for film titles and ratings'
-        )
+    _render_advanced_analytics(df_filtered, fingerprint)
     
     st.markdown("---")
     
     # ========================================================================
     # FOOTER
     # ========================================================================
-    st.markdown("""
-    <div style="
-        text-align: center;
-        color: #666;
-        margin-top: 40px;
-        padding: 20px;
-        border-top: 1px solid #333;
-    ">
-        <small>
-         <strong>The 007 Data Dossier</strong> | Advanced Analysis of James Bond Films & Actor Performance<br>
-        <em>Data Source: IMDb | Last Updated: November 2025</em>
-        </small>
-    </div>
-    """, unsafe_allow_html=True)
\ No newline at end of file
+    render_page_footer(
+        "The 007 Data Dossier",
+        "Advanced Analysis of James Bond Films & Actor Performance",
+        "Data Source: IMDb | Last Updated: November 2025"
+    )
\ No newline at end of file
@@ -2,37 +2,150 @@
 
 import streamlit as st
 import altair as alt
+import numpy as np
 import pandas as pd
 
 try:
-    from ..config import ACCENT_BLUE, ACCENT_RED, ACCENT_GOLD, ACCENT_ORANGE, ACCENT_GREEN
-    from ..components import initialize_page_styles, render_page_header, render_section_header
-    from ..charts import filter_to_specific_bond_films, create_bond_films_rating_chart, create_actor_performance_chart
+    from ..config import get_bond_theme
+    from ..components import (
+        render_page_header, render_section_header, render_page_footer, cached_chart_spec
+    )
+    from ..charts import create_bond_films_rating_chart, create_actor_performance_chart
+    from ..data_loader import load_bond_films, get_specific_bond_films, get_data_path
 except ImportError:
-    from config import ACCENT_BLUE, ACCENT_RED, ACCENT_GOLD, ACCENT_ORANGE, ACCENT_GREEN
-    from components import initialize_page_styles, render_page_header, render_section_header
-    from charts import filter_to_specific_bond_films, create_bond_films_rating_chart, create_actor_performance_chart
+    from config import get_bond_theme
+    from components import (
+        render_page_header, render_section_header, render_page_footer, cached_chart_spec
+    )
+    from charts import create_bond_films_rating_chart, create_actor_performance_chart
+    from data_loader import load_bond_films, get_specific_bond_films, get_data_path
+
+
+# Page-local charts are plain Vega-Lite dicts like the Actor Universe ones: no Altair
+# validation or to_dict() per rerun, so the registered theme config is attached by hand
+_THEME_CONFIG = get_bond_theme()['config']
+_CRAIG_COLUMNS = ['primaryTitle', 'releaseYear', 'averageRating', 'numVotes', 'runtimeMinutes']
+_POPULARITY_COLUMNS = ['primaryTitle', 'releaseYear', 'numVotes', 'leadActor']
+
+
+# df_full is the shared frame from load_and_preprocess_data, so identity is a sound cache
+# key; the page only reads the result, so it is shared as a resource rather than copied
+@st.cache_resource(show_spinner=False, hash_funcs={pd.DataFrame: id})
+def _story_films(df_full):
+    """The 14 target Bond films in release order."""
+    df_story = get_specific_bond_films(df_full)
+    if df_story.empty:
+        return df_story
+    return df_story.sort_values('releaseYear').reset_index(drop=True)
+
+
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: id})
+def _era_positions(df_story):
+    """Row positions of each Bond actor's era in the story frame, from one groupby."""
+    return df_story.groupby('leadActor', observed=True).indices
+
+
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: id})
+def _story_metrics(df_story):
+    """Average rating, total votes and average runtime of the story films."""
+    # Plain ndarray reductions; the mean accumulates in float64 like pandas does
+    return (
+        float(df_story['averageRating'].to_numpy().mean(dtype=np.float64)),
+        float(df_story['numVotes'].to_numpy().sum(dtype=np.float64)),
+        float(df_story['runtimeMinutes'].to_numpy().mean(dtype=np.float64))
+    )
+
+
+# st.cache_data hands back a fresh copy per rerun, so Streamlit can adjust the dict
+@st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: id})
+def _craig_spec(df_story):
+    """Vega-Lite spec for the Craig-era bubble chart with its films inlined, or None without any."""
+    positions = _era_positions(df_story).get('Daniel Craig')
+    if positions is None:
+        return None
+    # A handful of rows is smaller as inline JSON than as an Arrow table. Streamlit only
+    # moves top-level data to Arrow, so the values ride on the chart's single layer.
+    # Ratings have one decimal; rounding drops the float32 noise from the JSON.
+    values = df_story.iloc[positions][_CRAIG_COLUMNS].astype({'averageRating': np.float64}).round(
+        {'averageRating': 1}
+    ).to_dict(orient='records')
+    return {
+        '$schema': alt.SCHEMA_URL,
+        'title': 'Daniel Craig Era: Evolution of Ratings and Popularity',
+        'height': 400,
+        'layer': [{
+            'data': {'values': values},
+            'mark': {'type': 'circle', 'size': 200, 'stroke': 'white', 'strokeWidth': 2},
+            'encoding': {
+                'x': {'field': 'releaseYear', 'type': 'ordinal', 'title': 'Release Year'},
+                'y': {
+                    'field': 'averageRating', 'type': 'quantitative', 'title': 'IMDb Rating',
+                    'scale': {'domain': [6, 8.5]}
+                },
+                'size': {
+                    'field': 'numVotes', 'type': 'quantitative', 'title': 'Popularity (Votes)',
+                    'scale': {'range': [100, 600]},
+                    'legend': {'title': 'Popularity (Votes)', 'format': ','}
+                },
+                'color': {
+                    'field': 'averageRating', 'type': 'quantitative',
+                    'scale': {'scheme': 'reds', 'domain': [6.5, 8.0]},
+                    'legend': {'title': 'Rating'}
+                },
+                'tooltip': [
+                    {'field': 'primaryTitle', 'type': 'nominal', 'title': 'Film'},
+                    {'field': 'releaseYear', 'type': 'ordinal', 'title': 'Year'},
+                    {'field': 'averageRating', 'type': 'quantitative', 'title': 'Rating', 'format': '.2f'},
+                    {'field': 'numVotes', 'type': 'quantitative', 'title': 'Votes', 'format': ','},
+                    {'field': 'runtimeMinutes', 'type': 'quantitative', 'title': 'Runtime (mins)'}
+                ]
+            }
+        }],
+        'config': _THEME_CONFIG
+    }
+
+
+@st.cache_data(show_spinner=False)
+def _popularity_spec():
+    """Vega-Lite spec for the log-scale votes line across the four Bond eras."""
+    return {
+        '$schema': alt.SCHEMA_URL,
+        'title': 'Audience Engagement Over Time (Log Scale)',
+        'height': 400,
+        'mark': {'type': 'line', 'point': True, 'strokeWidth': 3},
+        'encoding': {
+            'x': {'field': 'releaseYear', 'type': 'ordinal', 'title': 'Release Year'},
+            'y': {
+                'field': 'numVotes', 'type': 'quantitative', 'title': 'Number of Votes (Popularity)',
+                'scale': {'type': 'log'},
+                'axis': {'format': '.0s'}
+            },
+            'color': {'field': 'leadActor', 'type': 'nominal', 'title': 'Bond Actor'},
+            'tooltip': [
+                {'field': 'primaryTitle', 'type': 'nominal', 'title': 'Film'},
+                {'field': 'releaseYear', 'type': 'ordinal', 'title': 'Year'},
+                {'field': 'numVotes', 'type': 'quantitative', 'title': 'Votes', 'format': ','},
+                {'field': 'leadActor', 'type': 'nominal', 'title': 'Actor'}
+            ]
+        },
+        'config': _THEME_CONFIG
+    }
 
 
 def render_story_mode(df_full):
     """Render the Story Mode page with professional design consistency."""
     
-    initialize_page_styles()
-    
     render_page_header(
         "The Bond Legacy: A Journey Through 40 Years",
         "A data-driven narrative of the modern James Bond era (1981-2021)"
     )
 
-    # Filter to only the 14 specific Bond films
-    df_story = filter_to_specific_bond_films(df_full)
+    # The 14 specific Bond films, sorted by release year for the chronological narrative
+    df_story = _story_films(df_full)
     
     if df_story.empty:
         st.error("No Bond films found in the dataset.")
         return
-    
-    # Sort by release year for chronological narrative
-    df_story = df_story.sort_values('releaseYear').reset_index(drop=True)
 
     # ========================================================================
     # CHAPTER 1: THE COMPLETE JOURNEY
@@ -48,10 +161,12 @@ def render_story_mode(df_full):
     reboot. Let's explore how ratings, popularity, and storytelling have evolved across these four decades.
     """)
     
-    # Use the bond films rating chart
-    bond_rating_chart = create_bond_films_rating_chart(df_full)
-    if bond_rating_chart:
-        st.altair_chart(bond_rating_chart, use_container_width=True)
+    # Use the bond films rating chart (the same cached spec the overview renders)
+    bond_rating_spec = cached_chart_spec(
+        'bond_films_rating', None, create_bond_films_rating_chart, load_bond_films(get_data_path())
+    )
+    if bond_rating_spec:
+        st.vega_lite_chart(spec=bond_rating_spec, use_container_width=True)
     
     st.markdown("""
     **Key Observations:**
@@ -59,9 +174,9 @@ def render_story_mode(df_full):
     - Each actor brought a unique style: Moore's charm, Dalton's intensity, Brosnan's polish, and Craig's grit
     - The average rating line shows the franchise's remarkable consistency in quality
     - Notable peaks include *GoldenEye* (1995) and *Skyfall* (2012), both marking successful actor transitions
-    """)
     
-    st.markdown("---")
+    ---
+    """)
 
     # ========================================================================
     # CHAPTER 2: THE ACTOR TRANSITIONS
@@ -78,9 +193,9 @@ def render_story_mode(df_full):
     """)
     
     # Use the existing actor performance chart
-    actor_chart = create_actor_performance_chart(df_story)
-    if actor_chart:
-        st.altair_chart(actor_chart, use_container_width=True)
+    actor_spec = cached_chart_spec('story_actor_performance', None, create_actor_performance_chart, df_story)
+    if actor_spec:
+        st.vega_lite_chart(spec=actor_spec, use_container_width=True)
     else:
         st.warning("No actor statistics available.")
     
@@ -90,9 +205,9 @@ def render_story_mode(df_full):
     - **Pierce Brosnan** maintained strong ratings (7.0/10) across his four films, bringing Bond into the modern era
     - **Timothy Dalton** had the shortest tenure but delivered intense, critically-acclaimed performances
     - **Roger Moore** closed his era with consistent quality, maintaining the franchise's appeal
-    """)
     
-    st.markdown("---")
+    ---
+    """)
 
     # ========================================================================
     # CHAPTER 3: THE MODERN REBOOT (CRAIG ERA)
@@ -102,7 +217,6 @@ def render_story_mode(df_full):
         "Daniel Craig: Redefining Bond for a new generation"
     )
     
-    df_craig = df_story[df_story['leadActor'] == 'Daniel Craig'].sort_values('releaseYear').copy()
     
     st.markdown("""
     The **Daniel Craig** era represents the most significant transformation in Bond's history. Starting with 
@@ -111,31 +225,11 @@ def render_story_mode(df_full):
     became the highest-grossing Bond film of all time.
     """)
     
-    if not df_craig.empty:
-        # Craig films popularity and ratings
-        craig_chart = alt.Chart(df_craig).mark_circle(size=200, stroke='white', strokeWidth=2).encode(
-            x=alt.X('releaseYear:O', title="Release Year"),
-            y=alt.Y('averageRating:Q', title="IMDb Rating", scale=alt.Scale(domain=[6, 8.5])),
-            size=alt.Size('numVotes:Q', 
-                         scale=alt.Scale(range=[100, 600]),
-                         title="Popularity (Votes)",
-                         legend=alt.Legend(title="Popularity (Votes)", format=",")),
-            color=alt.Color('averageRating:Q',
-                          scale=alt.Scale(scheme='reds', domain=[6.5, 8.0]),
-                          legend=alt.Legend(title="Rating")),
-            tooltip=[
-                alt.Tooltip('primaryTitle:N', title="Film"),
-                alt.Tooltip('releaseYear:O', title="Year"),
-                alt.Tooltip('averageRating:Q', title="Rating", format=".2f"),
-                alt.Tooltip('numVotes:Q', title="Votes", format=","),
-                alt.Tooltip('runtimeMinutes:Q', title="Runtime (mins)")
-            ]
-        ).properties(
-            height=400,
-            title="Daniel Craig Era: Evolution of Ratings and Popularity"
-        )
-        
-        st.altair_chart(craig_chart, use_container_width=True)
+    # Craig films popularity and ratings, already in release order: the story frame is
+    # sorted and the era positions ascend
+    craig_spec = _craig_spec(df_story)
+    if craig_spec:
+        st.vega_lite_chart(spec=craig_spec, use_container_width=True)
     
     st.markdown("""
     **Key Observations:**
@@ -143,9 +237,9 @@ def render_story_mode(df_full):
     - *Casino Royale* (2006) successfully rebooted the series with a fresh, gritty take
     - The Craig era shows increasing audience engagement over time, with *No Time to Die* (2021) reaching new heights
     - Longer runtimes in recent films reflect more complex storytelling and character development
-    """)
     
-    st.markdown("---")
+    ---
+    """)
 
     # ========================================================================
     # CHAPTER 4: THE EVOLUTION OF POPULARITY
@@ -162,24 +256,7 @@ def render_story_mode(df_full):
     """)
     
     # Popularity over time
-    popularity_chart = alt.Chart(df_story).mark_line(point=True, strokeWidth=3).encode(
-        x=alt.X('releaseYear:O', title="Release Year"),
-        y=alt.Y('numVotes:Q', title="Number of Votes (Popularity)", 
-               scale=alt.Scale(type='log'),
-               axis=alt.Axis(format=".0s")),
-        color=alt.Color('leadActor:N', title="Bond Actor"),
-        tooltip=[
-            alt.Tooltip('primaryTitle:N', title="Film"),
-            alt.Tooltip('releaseYear:O', title="Year"),
-            alt.Tooltip('numVotes:Q', title="Votes", format=","),
-            alt.Tooltip('leadActor:N', title="Actor")
-        ]
-    ).properties(
-        height=400,
-        title="Audience Engagement Over Time (Log Scale)"
-    )
-    
-    st.altair_chart(popularity_chart, use_container_width=True)
+    st.vega_lite_chart(df_story[_POPULARITY_COLUMNS], _popularity_spec(), use_container_width=True)
     
     st.markdown("""
     **Key Observations:**
@@ -187,9 +264,9 @@ def render_story_mode(df_full):
     - *Skyfall* and *No Time to Die* show the highest engagement, reflecting modern global reach
     - The Brosnan era marked a significant increase in popularity, bringing Bond to a new generation
     - Even older films maintain strong engagement, showing the franchise's enduring appeal
-    """)
     
-    st.markdown("---")
+    ---
+    """)
 
     # ========================================================================
     # CONCLUSION
@@ -199,29 +276,27 @@ def render_story_mode(df_full):
         "What 40 years of data tells us about Bond's future"
     )
     
-    # Summary statistics
+    # Summary statistics (avg_rating is reused by the closing text below)
+    avg_rating, total_votes, avg_runtime = _story_metrics(df_story)
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
         st.metric("Total Films", len(df_story))
     
     with col2:
-        avg_rating = df_story['averageRating'].mean()
         st.metric("Average Rating", f"{avg_rating:.2f}/10")
     
     with col3:
-        total_votes = df_story['numVotes'].sum()
         st.metric("Total Votes", f"{total_votes:,.0f}")
     
     with col4:
-        avg_runtime = df_story['runtimeMinutes'].mean()
         st.metric("Avg Runtime", f"{avg_runtime:.0f} min")
     
-    st.markdown("""
+    st.markdown(f"""
     Over 40 years and 14 films, the James Bond franchise has demonstrated remarkable resilience and evolution:
     
     1. **Consistent Quality**: Despite changing actors and styles, the franchise has maintained an average rating 
-       of **{:.2f}/10**, showing consistent quality across decades.
+       of **{avg_rating:.2f}/10**, showing consistent quality across decades.
     
     2. **Growing Popularity**: Modern films achieve unprecedented audience engagement, with the Craig era 
        reaching millions more viewers than earlier films.
@@ -234,15 +309,12 @@ def render_story_mode(df_full):
     
     The next Bond actor will inherit a franchise that has proven its ability to evolve while staying true to 
     its core—a formula that has worked for over 60 years and will continue into the future.
-    """.format(avg_rating))
     
-    st.markdown("---")
+    ---
+    """)
     
-    st.markdown("""
-    <div style="text-align: center; color: #666; margin-top: 40px; padding: 20px; border-top: 1px solid #333;">
-        <small>
-        <strong>Story Mode</strong> | Data-Driven Narrative | 007 Data Dossier<br>
-        <em>Data Source: IMDb | Analysis: November 2025 | Films Analyzed: 14 Bond Films (1981-2021)</em>
-        </small>
-    </div>
-    """, unsafe_allow_html=True)
\ No newline at end of file
+    render_page_footer(
+        "Story Mode",
+        "Data-Driven Narrative | 007 Data Dossier",
+        "Data Source: IMDb | Analysis: November 2025 | Films Analyzed: 14 Bond Films (1981-2021)"
+    )
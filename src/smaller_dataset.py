@@ -1,31 +1,48 @@
+import numpy as np
 import pandas as pd
-import os
+from pathlib import Path
 
 # ------------------------------
 # Paths
 # ------------------------------
-project_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-data_dir = os.path.join(project_dir, "data", "processed")
-input_file = os.path.join(data_dir, "movies_merged.csv")
-output_file = os.path.join(data_dir, "movies_1990_onwards.csv")
+project_dir = Path(__file__).resolve().parent.parent
+data_dir = project_dir / "data" / "processed"
+input_file = data_dir / "movies_merged.csv"
+# Written by merge_datasets.py
+parquet_file = data_dir / "movies_clean.parquet"
+output_file = data_dir / "movies_1990_onwards.csv"
 
 # ------------------------------
-# Load CSV
-# ------------------------------
-movies = pd.read_csv(input_file, na_values="\\N")
+# Load movies from 1990 onwards
+# ------------------------------
+# A Parquet copy skips CSV parsing entirely, and the year filter is pushed into the
+# reader so row groups that end before 1990 are never decoded. The CSV is still read
+# and filtered when merge_datasets.py has not written the Parquet export
+if parquet_file.exists():
+    movies_filtered = pd.read_parquet(parquet_file, filters=[('startYear', '>=', 1990)])
+    # The Parquet export is sorted by year for the filter above; restore IMDb's tconst
+    # order so the CSV matches the one derived from movies_merged.csv
+    movies_filtered = movies_filtered.sort_values(
+        'tconst', key=lambda tconst: tconst.str[2:].astype('int64'), kind='stable', ignore_index=True
+    )
+else:
+    movies = pd.read_csv(input_file, na_values="\\N", dtype_backend="pyarrow")
 
-# ------------------------------
-# Filter for movies from 1990 onwards
-# ------------------------------
-# Ensure startYear is numeric
-movies['startYear'] = pd.to_numeric(movies['startYear'], errors='coerce')
+    # Ensure startYear is numeric; the reader already types it unless a row is malformed
+    if not pd.api.types.is_numeric_dtype(movies['startYear']):
+        movies['startYear'] = pd.to_numeric(movies['startYear'], errors='coerce')
 
-movies_filtered = movies[movies['startYear'] >= 1990]
+    # One compare on the raw year values, then a single positional gather
+    is_recent = movies['startYear'].to_numpy(dtype='float64', na_value=np.nan) >= 1990
+    movies_filtered = movies.take(np.flatnonzero(is_recent))
 
 # ------------------------------
 # Save filtered CSV
 # ------------------------------
+# genre_list has no CSV form (a list column or a Python list repr); Tableau splits the
+# comma-separated genres column itself
+movies_filtered = movies_filtered.drop(columns='genre_list', errors='ignore')
 movies_filtered.to_csv(output_file, index=False)
 
 print(f"Filtered movies saved: {output_file}")
-print(f"Total movies >=1980: {len(movies_filtered)}")
+print(f"Total movies >=1990: {len(movies_filtered)}")